@@ -0,0 +1,35 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled servo-count <-> radian conversions for WaveshareHWI.
+
+Same math as the pure Python versions in waveshare_position_hwi.py:
+count = int(rad * scale + center) clamped to [0, max_count], with
+scale = counts_per_pi / (2 * pi). Optional: the HWI falls back to Python
+when this isn't built.
+"""
+
+
+cpdef int rad_to_servo_pos(double rad, int center, double scale, int max_count) nogil:
+    cdef int pos = <int>(rad * scale + center)
+    if pos < 0:
+        return 0
+    if pos > max_count:
+        return max_count
+    return pos
+
+
+cpdef double servo_pos_to_rad(int count, int center, double scale) nogil:
+    return (count - center) / scale
+
+
+def rad_to_servo_pos_batch(const double[::1] rads, int[::1] out, int center, double scale, int max_count):
+    cdef Py_ssize_t i, n = rads.shape[0]
+    with nogil:
+        for i in range(n):
+            out[i] = rad_to_servo_pos(rads[i], center, scale, max_count)
+
+
+def servo_pos_to_rad_batch(const int[::1] counts, double[::1] out, int center, double scale):
+    cdef Py_ssize_t i, n = counts.shape[0]
+    with nogil:
+        for i in range(n):
+            out[i] = (counts[i] - center) / scale
@@ -2,11 +2,73 @@
 # Raspberry Pi + BNO085 UART-RVC threaded version
 
 import time
+import struct
 import serial
 import numpy as np
-from queue import Queue
 from threading import Thread
-from adafruit_bno08x_rvc import BNO08x_RVC
+from adafruit_bno08x_rvc import BNO08x_RVC, RVCReadTimeoutError
+
+from mini_bdx_runtime.serial_utils import set_low_latency
+
+UART_PORT = "/dev/serial0"
+UART_BAUD = 115200
+
+# RVC frame: 0xAA 0xAA, index, yaw, pitch, roll, x/y/z accel (int16),
+# 3 reserved bytes, checksum (sum of index..reserved)
+RVC_HEADER = b"\xaa\xaa"
+RVC_FRAME_LEN = 19
+_RVC_PAYLOAD = struct.Struct("<xhhhhhh")
+
+
+def open_rvc_uart():
+    uart = serial.Serial(UART_PORT, UART_BAUD, timeout=1)
+    # Surface each frame as soon as it arrives instead of in bursts
+    set_low_latency(uart)
+    return uart
+
+
+class BufferedRVC(BNO08x_RVC):
+    """BNO08x_RVC that drains the UART buffer and only parses the newest frame.
+
+    The stock `heading` flushes the input buffer and waits for a fresh frame
+    every call. Here whatever is pending is read in one go and scanned from the
+    end, so older frames are skipped without being unpacked.
+    """
+
+    def __init__(self, uart, timeout=1.0):
+        super().__init__(uart, timeout)
+        self._buf = bytearray()
+
+    def _pop_latest(self):
+        buf = self._buf
+        start = buf.rfind(RVC_HEADER, 0, len(buf) - RVC_FRAME_LEN + 2)
+        while start >= 0:
+            frame = buf[start + 2 : start + RVC_FRAME_LEN]
+            if sum(frame[:16]) & 0xFF == frame[16]:
+                del buf[: start + RVC_FRAME_LEN]
+                yaw, pitch, roll, x_accel, y_accel, z_accel = _RVC_PAYLOAD.unpack_from(frame)
+                return (
+                    yaw * 0.01,
+                    pitch * 0.01,
+                    roll * 0.01,
+                    x_accel * 0.0098067,
+                    y_accel * 0.0098067,
+                    z_accel * 0.0098067,
+                )
+            start = buf.rfind(RVC_HEADER, 0, start + 1)
+        # nothing valid, only keep what could be the start of the next frame
+        del buf[: -(RVC_FRAME_LEN - 1)]
+        return None
+
+    @property
+    def heading(self):
+        deadline = time.monotonic() + self._read_timeout
+        while time.monotonic() < deadline:
+            self._buf += self._uart.read(max(self._uart.in_waiting, RVC_FRAME_LEN))
+            heading = self._pop_latest()
+            if heading is not None:
+                return heading
+        raise RVCReadTimeoutError("Unable to read RVC heading message")
 
 
 class Imu:
@@ -16,16 +78,20 @@ class Imu:
         user_pitch_bias=0,
         upside_down=True,
     ):
+        # The sensor streams RVC frames at its own 100 Hz, the worker just
+        # blocks on the UART. Kept for compatibility with the other Imu classes.
         self.sampling_freq = sampling_freq
         self.user_pitch_bias = user_pitch_bias
         self.upside_down = upside_down
 
         # Open hardware UART
-        self.uart = serial.Serial("/dev/serial0", 115200, timeout=1)
+        self.uart = open_rvc_uart()
 
         # Create IMU instance
-        self.imu = BNO08x_RVC(self.uart)
+        self.imu = BufferedRVC(self.uart)
 
+        # Latest sample wins: the worker rebinds this dict, which is atomic
+        # under the GIL, so no queue/lock is needed between the two threads.
         self.last_imu_data = {
             "yaw": 0,
             "pitch": 0,
@@ -33,15 +99,12 @@ class Imu:
             "accelero": [0, 0, 0],
         }
 
-        self.imu_queue = Queue(maxsize=1)
-
         Thread(target=self.imu_worker, daemon=True).start()
 
     def imu_worker(self):
         while True:
-            start = time.time()
-
             try:
+                # Blocks until the next frame from the sensor
                 yaw, pitch, roll, x_accel, y_accel, z_accel = self.imu.heading
 
                 # Apply pitch bias
@@ -58,23 +121,14 @@ class Imu:
                     "accelero": [x_accel, y_accel, z_accel],
                 }
 
-                if self.imu_queue.full():
-                    self.imu_queue.get()
-
-                self.imu_queue.put(data)
+                self.last_imu_data = data
 
             except Exception as e:
                 print("[IMU ERROR]:", e)
-
-            elapsed = time.time() - start
-            time.sleep(max(0, 1 / self.sampling_freq - elapsed))
+                # don't spin if the UART itself is failing
+                time.sleep(0.01)
 
     def get_data(self):
-        try:
-            self.last_imu_data = self.imu_queue.get(False)
-        except:
-            pass
-
         return self.last_imu_data
 
 
@@ -2,9 +2,9 @@
 # Raspberry Pi + BNO085 UART-RVC test
 
 import time
-import serial
 import numpy as np
-from adafruit_bno08x_rvc import BNO08x_RVC
+
+from mini_bdx_runtime.imu2 import BufferedRVC, open_rvc_uart
 
 
 class Imu:
@@ -12,10 +12,10 @@ class Imu:
         self.sampling_freq = sampling_freq
 
         # Open Raspberry Pi hardware UART
-        self.uart = serial.Serial("/dev/serial0", 115200, timeout=1)
+        self.uart = open_rvc_uart()
 
         # Initialize RVC mode driver
-        self.imu = BNO08x_RVC(self.uart)
+        self.imu = BufferedRVC(self.uart)
 
     def read(self):
         yaw, pitch, roll, x_accel, y_accel, z_accel = self.imu.heading
@@ -0,0 +1,129 @@
+"""Helpers shared by the serial-bus code (servo HWIs, UART IMU, scripts)."""
+
+import select
+import struct
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Windows
+    fcntl = None
+    termios = None
+
+# <linux/serial.h>
+TIOCGSERIAL = getattr(termios, "TIOCGSERIAL", 0x541E)
+TIOCSSERIAL = getattr(termios, "TIOCSSERIAL", 0x541F)
+ASYNC_LOW_LATENCY = 0x2000
+# big enough for struct serial_struct, `flags` is its 5th int
+_SERIAL_STRUCT_SIZE = 128
+_FLAGS_OFFSET = 16
+
+COMM_SUCCESS = 0  # scservo_def.COMM_SUCCESS
+
+
+def set_low_latency(ser):
+    """Enable ASYNC_LOW_LATENCY on a serial port.
+
+    FTDI/CH340 USB-UART bridges coalesce incoming bytes for 16 ms by default,
+    which caps every request/response round-trip on the servo bus. Low latency
+    mode drops that to ~1 ms.
+
+    `ser` can be a pyserial `Serial`, a scservo `PortHandler` (its `ser` is
+    used) or a raw file descriptor. Call it *after* `setBaudRate`, the
+    PortHandler re-creates its `Serial` there.
+
+    Returns True on success, False if the platform or driver doesn't support it.
+    """
+    ser = getattr(ser, "ser", ser)
+    if ser is None:
+        return False
+
+    if hasattr(ser, "set_low_latency_mode"):
+        try:
+            ser.set_low_latency_mode(True)
+            return True
+        except (ValueError, OSError):
+            return False
+
+    fd = ser if isinstance(ser, int) else getattr(ser, "fd", None)
+    if fd is None or fcntl is None:
+        return False
+    try:
+        buf = bytearray(_SERIAL_STRUCT_SIZE)
+        fcntl.ioctl(fd, TIOCGSERIAL, buf)
+        (flags,) = struct.unpack_from("i", buf, _FLAGS_OFFSET)
+        struct.pack_into("i", buf, _FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, TIOCSSERIAL, buf)
+    except OSError:
+        return False
+    return True
+
+
+def use_blocking_reads(port):
+    """Make a scservo `PortHandler` sleep until reply bytes arrive.
+
+    The SDK opens the port with `timeout=0` and `rxPacket` polls `readPort` in
+    a tight loop until the packet or its timeout is complete, burning a core and
+    thousands of read syscalls per transaction. The replacement `readPort`
+    waits in `select` for the bytes (bounded by the remaining packet timeout)
+    before doing the non-blocking read, so each reply costs a handful of
+    syscalls and the control loop isn't competing with a spinning reader.
+
+    Returns False (and leaves the port alone) where the serial object has no
+    pollable fd, e.g. on Windows.
+    """
+    ser = getattr(port, "ser", None)
+    if getattr(ser, "fd", None) is None:
+        return False
+
+    def readPort(length):
+        ser = port.ser
+        remaining = (port.packet_timeout - port.getTimeSinceStart()) / 1000.0
+        if remaining > 0:
+            select.select([ser.fd], [], [], remaining)
+        return ser.read(length)
+
+    port.readPort = readPort
+    return True
+
+
+def wait_stop(pkt, ids, timeout=2.0, period=0.02):
+    """Poll ReadMoving (~50 Hz) until every servo in `ids` has stopped.
+
+    Returns True once they all report not moving, False after `timeout` s
+    (so a servo that doesn't answer costs the same as the old fixed sleep).
+    """
+    pending = list(ids)
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        time.sleep(period)
+        still_moving = []
+        for sid in pending:
+            moving, comm, _ = pkt.ReadMoving(sid)
+            if comm != COMM_SUCCESS or moving:
+                still_moving.append(sid)
+        pending = still_moving
+    return not pending
+
+
+def cap_packet_timeout(port, msec):
+    """Cap the reply timeout of every transaction on `port` to `msec` ms.
+
+    The SDK re-arms the timeout from the packet length inside each txRxPacket
+    (50 ms of latency budget on the stservo port handler), so a missing id costs
+    that much per probe. Replies only need a few ms at 1 Mbps with low latency on.
+    """
+    port.setPacketTimeout = lambda packet_length: port.setPacketTimeoutMillis(msec)
+
+
+@contextmanager
+def short_packet_timeout(port, msec):
+    """`cap_packet_timeout` for the duration of a `with` block."""
+    cap_packet_timeout(port, msec)
+    try:
+        yield port
+    finally:
+        # drop the instance override, the class method is visible again
+        del port.setPacketTimeout
@@ -12,9 +12,18 @@ Key differences from Feetech:
 - Speed commands via WritePosEx method
 """
 
+import logging
+import struct
 import time
 import numpy as np
 from mini_bdx_runtime.duck_config import DuckConfig
+from mini_bdx_runtime.serial_utils import set_low_latency, use_blocking_reads, short_packet_timeout
+
+try:
+    # the compiled conversions (see setup.py), same results as the Python ones
+    from mini_bdx_runtime import _servo_math
+except ImportError:
+    _servo_math = None
 
 # Import Waveshare SDK - adjust path as needed based on your setup
 import sys
@@ -22,18 +31,64 @@ import os
 
 # Add path to Waveshare SDK
 # Adjust this path to match your installation
-SDK_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "STServo_Python", "stservo-env", "scservo_sdk")
-if os.path.exists(SDK_PATH):
+SDK_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "STServo_Python", "stservo-env", "scservo_sdk"))
+# Only once, reloads (test runners, autoreload) would keep growing sys.path
+if SDK_PATH not in sys.path and os.path.exists(SDK_PATH):
     sys.path.insert(0, SDK_PATH)
 
 try:
-    from scservo_sdk import PortHandler, sms_sts
-    from scservo_sdk.scservo_def import COMM_SUCCESS
+    from scservo_sdk import PortHandler, GroupSyncRead, sms_sts
+    from scservo_sdk.sms_sts import (
+        SMS_STS_ACC,
+        SMS_STS_BAUD_RATE,
+        SMS_STS_LOCK,
+        SMS_STS_PRESENT_CURRENT_L,
+        SMS_STS_PRESENT_POSITION_L,
+        SMS_STS_PRESENT_SPEED_L,
+        SMS_STS_PRESENT_TEMPERATURE,
+        SMS_STS_PRESENT_VOLTAGE,
+        SMS_STS_TORQUE_ENABLE,
+    )
+    from scservo_sdk.scservo_def import COMM_SUCCESS, INST_SYNC_READ, INST_SYNC_WRITE
+    from scservo_sdk.protocol_packet_handler import (
+        PKT_ID,
+        PKT_INSTRUCTION,
+        PKT_LENGTH,
+        PKT_PARAMETER0,
+    )
 except ImportError:
     print("WARNING: Could not import scservo_sdk. Make sure Waveshare SDK is in Python path.")
     PortHandler = None
+    GroupSyncRead = None
     sms_sts = None
+    SMS_STS_ACC = 41
+    SMS_STS_BAUD_RATE = 6
+    SMS_STS_LOCK = 55
+    SMS_STS_PRESENT_POSITION_L = 56
+    SMS_STS_PRESENT_SPEED_L = 58
+    SMS_STS_PRESENT_VOLTAGE = 62
+    SMS_STS_PRESENT_TEMPERATURE = 63
+    SMS_STS_PRESENT_CURRENT_L = 69
+    SMS_STS_TORQUE_ENABLE = 40
     COMM_SUCCESS = 0
+    INST_SYNC_READ = 130
+    INST_SYNC_WRITE = 131
+    PKT_ID = 2
+    PKT_LENGTH = 3
+    PKT_INSTRUCTION = 4
+    PKT_PARAMETER0 = 5
+
+logger = logging.getLogger(__name__)
+
+# Present position (56-57) and present speed (58-59), one sync read per tick
+PRESENT_BLOCK_LEN = 4
+# Status block: voltage (62) .. present current (69-70)
+STATUS_BLOCK_LEN = 9
+# Seconds a status sync read is reused before get_status refreshes it
+STATUS_PERIOD = 1.0
+# SMS/STS broadcast id; the bundled SDK's BROADCAST_ID (0xFF) isn't one, so
+# its sync read/write packets would never reach the servos
+SMS_STS_BROADCAST_ID = 0xFE
 
 
 class WaveshareHWI:
@@ -48,14 +103,32 @@ class WaveshareHWI:
     # 1 unit = 360/2048 = 0.176 degrees = 3.07 millidegrees
     SERVO_POS_RANGE = 2048
     SERVO_DEG_RANGE = 360.0
+    # ±π radians spans the full position range
+    RAD_TO_UNITS = SERVO_POS_RANGE / (2 * np.pi)
+    UNITS_TO_RAD = (2 * np.pi) / SERVO_POS_RANGE
+    
+    # Bus rate -> SMS_STS_BAUD_RATE register value (SMS_STS_1M .. SMS_STS_38400).
+    # 1 Mbps is the fastest the servos offer; not all of these open on the
+    # host side, see self.bus_baudrates
+    SERVO_BAUD_INDEX = {
+        1000000: 0,
+        500000: 1,
+        250000: 2,
+        128000: 3,
+        115200: 4,
+        76800: 5,
+        57600: 6,
+        38400: 7,
+    }
     
-    def __init__(self, duck_config: DuckConfig, usb_port: str = "/dev/ttyACM0"):
+    def __init__(self, duck_config: DuckConfig, usb_port: str = "/dev/ttyACM0", baudrate: int = 1000000):
         """
         Initialize Waveshare hardware interface
         
         Args:
             duck_config: DuckConfig object with joint offsets
             usb_port: Serial port name (e.g., "COM5" on Windows, "/dev/ttyACM0" on Linux)
+            baudrate: Bus baud rate the servos are configured for (see set_bus_baudrate)
         """
         self.duck_config = duck_config
         self.usb_port = usb_port
@@ -101,6 +174,30 @@ class WaveshareHWI:
         
         # Load joint offsets from duck config
         self.joints_offsets = self.duck_config.joints_offset
+
+        # (name, servo_id, offset) in joint order, walked by the per-servo loops
+        self._joints_iter = tuple(
+            (name, sid, self.joints_offsets[name]) for name, sid in self.joints.items()
+        )
+
+        # Joint order, offsets and home pose as arrays for vectorized conversions
+        self._joint_names = [name for name, _, _ in self._joints_iter]
+        self._all_idx = range(len(self._joint_names))
+        self._init_pos_arr = np.fromiter(
+            (self.init_pos[name] for name in self._joint_names),
+            dtype=np.float64,
+            count=len(self._joint_names),
+        )
+        self._offsets_arr = np.array(
+            [offset for _, _, offset in self._joints_iter], dtype=np.float64
+        )
+
+        # Scratch buffers reused every tick: the readers' outputs, then
+        # set_position_all's command vector and its servo counts
+        self._pos_buf = np.empty(len(self.joints), dtype=np.float64)
+        self._vel_buf = np.empty_like(self._pos_buf)
+        self._cmd_buf = np.empty_like(self._pos_buf)
+        self._servo_pos_buf = np.empty(len(self.joints), dtype=np.int32)
         
         # PID gains for each servo (14 DoF)
         self.kps = np.ones(len(self.joints)) * 32  # default KP
@@ -113,14 +210,58 @@ class WaveshareHWI:
         
         self.port_handler = PortHandler(usb_port)
         self.packet_handler = sms_sts(self.port_handler)
+
+        # Rates both the servos and PortHandler accept (getCFlagBaud has no
+        # 76800), the only ones set_bus_baudrate will switch to
+        self.bus_baudrates = {
+            rate: index
+            for rate, index in self.SERVO_BAUD_INDEX.items()
+            if self.port_handler.getCFlagBaud(rate) > 0
+        }
         
         # Open port and set baud rate
         if not self.port_handler.openPort():
             raise RuntimeError(f"Failed to open serial port {usb_port}")
         
-        # Set baud rate to 1Mbps (0 = 1000000 bps for SMS_STS series)
-        if not self.port_handler.setBaudRate(1000000):
-            raise RuntimeError("Failed to set baud rate")
+        # 1 Mbps by default (0 = 1000000 bps for SMS_STS series)
+        if not self.port_handler.setBaudRate(baudrate):
+            raise RuntimeError(f"Failed to set baud rate {baudrate}")
+
+        # Drop the USB-serial 16 ms latency timer (no-op where unsupported)
+        set_low_latency(self.port_handler)
+        use_blocking_reads(self.port_handler)
+
+        # Sync write entry: id, then ACC, goal position, goal time, goal speed
+        # (41..47) in the servo's byte order, packed into one reused buffer
+        # after the start address and entry length header
+        self._sync_write_entry = struct.Struct(
+            "<BBHHH" if self.packet_handler.scs_end == 0 else ">BBHHH"
+        )
+        self._sync_write_scratch = bytearray(2 + self._sync_write_entry.size * len(self.joints))
+        self._sync_write_scratch[0] = SMS_STS_ACC
+        self._sync_write_scratch[1] = self._sync_write_entry.size - 1
+
+        # One sync read returns the present position and speed of every joint
+        self._group_sync_read = GroupSyncRead(
+            self.packet_handler, SMS_STS_PRESENT_POSITION_L, PRESENT_BLOCK_LEN
+        )
+        for _, sid, _ in self._joints_iter:
+            self._group_sync_read.addParam(sid)
+
+        # Voltage/temperature/current change slowly, get_status serves them
+        # from one sync read of all joints at most every STATUS_PERIOD
+        self._group_status_read = GroupSyncRead(
+            self.packet_handler, SMS_STS_PRESENT_VOLTAGE, STATUS_BLOCK_LEN
+        )
+        for _, sid, _ in self._joints_iter:
+            self._group_status_read.addParam(sid)
+        self._status = {}
+        self._status_time = None
+
+        # turn_off reads the torque enable flag back after its broadcast write
+        self._group_torque_read = GroupSyncRead(self.packet_handler, SMS_STS_TORQUE_ENABLE, 1)
+        for _, sid, _ in self._joints_iter:
+            self._group_torque_read.addParam(sid)
         
         print(f"✓ Serial port {usb_port} opened successfully")
     
@@ -129,23 +270,55 @@ class WaveshareHWI:
         Convert radians to servo position value (0-2048)
         
         Assumes servo 0-position corresponds to 0 radians
-        and full rotation (±π or 2π based on servo mount) maps to position range
+        and full rotation (±π or 2π based on servo mount) maps to position range.
+        Accepts a scalar or an array and returns int32 of the same shape.
         """
         # This conversion depends on your mechanical setup
         # Adjust the formula based on your servo's mechanical limits
         # Example: assume ±π radians maps to 0-2048
-        servo_pos = (rad / np.pi) * (self.SERVO_POS_RANGE / 2) + (self.SERVO_POS_RANGE / 2)
-        return np.clip(servo_pos, 0, 2047)
+        servo_pos = np.multiply(rad, self.RAD_TO_UNITS) + self.SERVO_POS_RANGE / 2
+        return np.clip(servo_pos, 0, 2047).astype(np.int32)
     
     def servo_pos_to_rad(self, servo_pos):
         """
         Convert servo position value (0-2048) to radians
         
-        Inverse of rad_to_servo_pos
+        Inverse of rad_to_servo_pos (scalar or array)
         """
-        # Inverse conversion
-        rad = ((servo_pos - self.SERVO_POS_RANGE / 2) / (self.SERVO_POS_RANGE / 2)) * np.pi
-        return rad
+        return (np.subtract(servo_pos, self.SERVO_POS_RANGE / 2)) * self.UNITS_TO_RAD
+    
+    def set_bus_baudrate(self, baudrate):
+        """
+        Switch every servo on the bus, then the host port, to a new baud rate
+        
+        The servos are reconfigured together with broadcast writes (no replies)
+        and keep the rate across power cycles, so pass the same `baudrate` to
+        the constructor afterwards. A servo that misses the broadcast stays at
+        the old rate and has to be fixed on its own.
+        
+        Args:
+            baudrate: One of self.bus_baudrates
+            
+        Returns:
+            True if the writes went out and the host port was switched
+        """
+        # Checked before any EPROM write: a rate the host can't open would leave
+        # every servo unreachable
+        if baudrate not in self.bus_baudrates:
+            raise ValueError(f"Unsupported bus baud rate {baudrate}, expected one of {sorted(self.bus_baudrates)}")
+        
+        # Unlock EPROM and write the new rate while still on the old one
+        for address, value in ((SMS_STS_LOCK, 0), (SMS_STS_BAUD_RATE, self.bus_baudrates[baudrate])):
+            if self.packet_handler.write1ByteTxOnly(SMS_STS_BROADCAST_ID, address, value) != COMM_SUCCESS:
+                return False
+        
+        # The servos listen at the new rate from here on. setBaudRate re-creates
+        # the Serial, so low latency mode has to be set again
+        if not self.port_handler.setBaudRate(baudrate):
+            return False
+        set_low_latency(self.port_handler)
+        
+        return self.packet_handler.write1ByteTxOnly(SMS_STS_BROADCAST_ID, SMS_STS_LOCK, 1) == COMM_SUCCESS
     
     def set_kps(self, kps):
         """
@@ -158,7 +331,7 @@ class WaveshareHWI:
         # Note: Waveshare servos use different register for P gain
         # You may need to implement this based on your servo's protocol
         # For now, this is a placeholder
-        print(f"KP values set to: {kps}")
+        logger.debug("KP values set to: %s", kps)
     
     def set_kds(self, kds):
         """
@@ -169,7 +342,7 @@ class WaveshareHWI:
         """
         self.kds = np.array(kds)
         # Note: Waveshare servos use different register for D gain
-        print(f"KD values set to: {kds}")
+        logger.debug("KD values set to: %s", kds)
     
     def set_kp(self, servo_id, kp):
         """
@@ -180,7 +353,7 @@ class WaveshareHWI:
             kp: KP value
         """
         # Implement single servo KP setting if needed
-        print(f"KP for servo {servo_id} set to: {kp}")
+        logger.debug("KP for servo %s set to: %s", servo_id, kp)
     
     def turn_on(self):
         """
@@ -200,7 +373,7 @@ class WaveshareHWI:
         time.sleep(0.5)
         
         # Step 2: Move to initial positions
-        self.set_position_all(self.init_pos)
+        self.set_position_all_arr(self._init_pos_arr)
         print("  - Initial positions sent")
         time.sleep(2.5)  # Wait for servos to reach position
         
@@ -216,15 +389,38 @@ class WaveshareHWI:
         Disable torque on all servos
         """
         print("Turning off servos...")
-        servo_ids = list(self.joints.values())
-        for servo_id in servo_ids:
-            # Write 0 to TORQUE_ENABLE (register varies by protocol)
-            # This is a placeholder - adjust based on your servo protocol
+        # One broadcast write reaches every servo, none of them answer it
+        try:
+            self.packet_handler.write1ByteTxOnly(SMS_STS_BROADCAST_ID, SMS_STS_TORQUE_ENABLE, 0)
+        except Exception:
+            pass
+
+        # Nothing acknowledges a broadcast, read the flag back to confirm
+        read = self._group_torque_read
+        try:
+            synced = self._sync_read(read) == COMM_SUCCESS
+        except Exception:
+            synced = False
+        still_on = []
+        for _, servo_id, _ in self._joints_iter:
+            if synced and read.isAvailable(servo_id, SMS_STS_TORQUE_ENABLE, 1)[0] \
+                    and read.getData(servo_id, SMS_STS_TORQUE_ENABLE, 1) == 0:
+                continue
+            # Not confirmed off, use an acknowledged write for this servo
             try:
-                self.packet_handler.write1ByteTxRx(servo_id, 40, 0)  # 40 is SMS_STS_TORQUE_ENABLE
-            except:
-                pass
+                comm_result, _ = self.packet_handler.write1ByteTxRx(
+                    servo_id, SMS_STS_TORQUE_ENABLE, 0
+                )
+            except Exception:
+                comm_result = None
+            if comm_result != COMM_SUCCESS:
+                still_on.append(servo_id)
+
+        if still_on:
+            print(f"WARNING: could not confirm torque off for servos {still_on}")
+            return False
         print("✓ Servos powered off")
+        return True
     
     def set_position(self, joint_name, pos):
         """
@@ -239,8 +435,13 @@ class WaveshareHWI:
         # Apply offset
         pos_with_offset = pos + self.joints_offsets[joint_name]
         
-        # Convert to servo position
-        servo_pos = int(self.rad_to_servo_pos(pos_with_offset))
+        # Convert to servo position (scalar, skip the numpy round-trip when compiled)
+        if _servo_math is not None:
+            servo_pos = _servo_math.rad_to_servo_pos(
+                pos_with_offset, self.SERVO_POS_RANGE // 2, self.RAD_TO_UNITS, 2047
+            )
+        else:
+            servo_pos = int(self.rad_to_servo_pos(pos_with_offset))
         
         # Send command
         # WritePosEx(id, position, speed, acceleration)
@@ -251,7 +452,7 @@ class WaveshareHWI:
             acceleration = 30  # Default acceleration
             self.packet_handler.WritePosEx(servo_id, servo_pos, speed, acceleration)
         except Exception as e:
-            print(f"Error setting position for {joint_name}: {e}")
+            logger.warning("Error setting position for %s: %s", joint_name, e)
     
     def set_position_all(self, joints_positions):
         """
@@ -260,93 +461,182 @@ class WaveshareHWI:
         Args:
             joints_positions: Dict with joint names as keys and positions (radians) as values
         """
-        for joint_name, position in joints_positions.items():
-            # Skip if joint not in mapping
-            if joint_name not in self.joints:
-                continue
-            
-            servo_id = self.joints[joint_name]
-            
-            # Apply offset
-            pos_with_offset = position + self.joints_offsets[joint_name]
-            
-            # Convert to servo position
-            servo_pos = int(self.rad_to_servo_pos(pos_with_offset))
-            
-            try:
-                speed = 500  # Default speed
-                acceleration = 30  # Default acceleration
-                self.packet_handler.WritePosEx(servo_id, servo_pos, speed, acceleration)
-            except Exception as e:
-                print(f"Error setting position for {joint_name}: {e}")
+        # Joints not in the mapping are skipped, missing ones are left alone
+        idx = [i for i, name in enumerate(self._joint_names) if name in joints_positions]
+        positions = self._cmd_buf[:len(idx)]
+        for k, i in enumerate(idx):
+            positions[k] = joints_positions[self._joint_names[i]]
+        self._write_positions(positions, idx)
+    
+    def set_position_all_arr(self, positions):
+        """
+        Set positions for all joints from an array, without the dict lookups
+        
+        Args:
+            positions: len(self.joints) positions (radians) in self.joints order
+        """
+        self._cmd_buf[:] = positions
+        self._write_positions(self._cmd_buf, self._all_idx)
+    
+    def _write_positions(self, positions, idx):
+        """
+        Convert `positions` (radians, one per joint index in `idx`) to servo
+        counts in place and send them in a single sync write packet
+        """
+        if not idx:
+            return
+
+        # Apply offsets and convert the whole vector in place, same math as
+        # rad_to_servo_pos without the temporaries
+        positions += self._offsets_arr if len(idx) == len(self._offsets_arr) else self._offsets_arr[idx]
+        positions *= self.RAD_TO_UNITS
+        positions += self.SERVO_POS_RANGE / 2
+        np.clip(positions, 0, 2047, out=positions)
+        servo_pos = self._servo_pos_buf[:len(idx)]
+        servo_pos[:] = positions  # truncates like int()
+
+        speed = 500  # Default speed
+        acceleration = 30  # Default acceleration
+
+        # All targets go out in a single sync write packet (no status replies)
+        entry = self._sync_write_entry
+        scratch = self._sync_write_scratch
+        for k, (i, pos) in enumerate(zip(idx, servo_pos)):
+            entry.pack_into(
+                scratch, 2 + k * entry.size, self._joints_iter[i][1], acceleration, int(pos), 0, speed
+            )
+        try:
+            self._broadcast(INST_SYNC_WRITE, memoryview(scratch)[:2 + len(idx) * entry.size])
+        except Exception as e:
+            logger.warning("Error setting positions: %s", e)
+    
+    def _broadcast(self, instruction, params):
+        """
+        Send one instruction packet to SMS_STS_BROADCAST_ID, no status reply
+        """
+        txpacket = [0] * (len(params) + 6)
+        txpacket[PKT_ID] = SMS_STS_BROADCAST_ID
+        txpacket[PKT_LENGTH] = len(params) + 2
+        txpacket[PKT_INSTRUCTION] = instruction
+        txpacket[PKT_PARAMETER0:PKT_PARAMETER0 + len(params)] = params
+        result = self.packet_handler.txPacket(txpacket)
+        self.port_handler.is_using = False
+        return result
+
+    def _sync_read(self, group):
+        """
+        Same as group.txRxPacket(), with the request sent to SMS_STS_BROADCAST_ID
+        """
+        if group.is_param_changed or not group.param:
+            group.makeParam()
+        result = self._broadcast(
+            INST_SYNC_READ, [group.start_address, group.data_length] + group.param
+        )
+        if result != COMM_SUCCESS:
+            return result
+        return group.rxPacket()
+
+    def _sync_read_present(self):
+        """
+        Refresh the present position/speed block of all joints in one transaction
+        
+        Returns False if the bus doesn't answer the sync read
+        """
+        try:
+            return self._sync_read(self._group_sync_read) == COMM_SUCCESS
+        except Exception:
+            return False
+    
+    def _synced_word(self, servo_id, address):
+        """
+        Signed word at `address` for `servo_id` from the last sync read, None if it didn't answer
+        """
+        available, _ = self._group_sync_read.isAvailable(servo_id, address, 2)
+        if not available:
+            return None
+        return self.packet_handler.scs_tohost(
+            self._group_sync_read.getData(servo_id, address, 2), 15
+        )
     
-    def get_present_positions(self, ignore=[]):
+    def get_present_positions(self, ignore=[], out=None):
         """
         Read present positions from all servos
         
         Args:
             ignore: List of joint names to ignore
+            out: Optional preallocated float array (one slot per non-ignored
+                joint) filled in place instead of allocating a new one
             
         Returns:
             NumPy array of positions in radians for non-ignored joints
+            (`out` itself when given). Without `out` a fresh copy is returned,
+            the readings themselves go through a buffer reused across calls
         """
-        present_positions = []
+        idx = [i for i, name in enumerate(self._joint_names) if name not in ignore]
+        raw = self._pos_buf[:len(idx)]
+        synced = self._sync_read_present()
         
-        for joint_name in self.joints.keys():
-            # Skip ignored joints
-            if joint_name in ignore:
-                continue
-            
-            servo_id = self.joints[joint_name]
-            
-            try:
-                # ReadPos returns (position, comm_result, error)
-                servo_pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
-                
-                if comm_result != COMM_SUCCESS:
-                    print(f"Error reading position from {joint_name}: comm_result={comm_result}")
-                    return None
-                
-                # Convert servo position to radians
-                rad_value = self.servo_pos_to_rad(servo_pos)
-                
-                # Remove offset
-                rad_value = rad_value - self.joints_offsets[joint_name]
-                
-                present_positions.append(rad_value)
-            except Exception as e:
-                print(f"Exception reading position from {joint_name}: {e}")
-                return None
+        try:
+            for k, i in enumerate(idx):
+                joint_name, servo_id, _ = self._joints_iter[i]
+                servo_pos = self._synced_word(servo_id, SMS_STS_PRESENT_POSITION_L) if synced else None
+                if servo_pos is None:
+                    # Servo missing from the sync read, ask it directly
+                    # ReadPos returns (position, comm_result, error)
+                    servo_pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
+                    if comm_result != COMM_SUCCESS:
+                        logger.warning("Error reading position from %s: comm_result=%s", joint_name, comm_result)
+                        return None
+                raw[k] = servo_pos
+        except Exception as e:
+            logger.warning("Exception reading position from %s: %s", joint_name, e)
+            return None
         
-        return np.array(np.around(present_positions, 3))
+        # Convert to radians and remove offsets for the whole vector, in place
+        raw -= self.SERVO_POS_RANGE / 2
+        raw *= self.UNITS_TO_RAD
+        raw -= self._offsets_arr if len(idx) == len(self._offsets_arr) else self._offsets_arr[idx]
+        # Round to 3 decimals in place, same values as np.around(raw, 3)
+        raw *= 1000.0
+        np.rint(raw, out=raw)
+        raw /= 1000.0
+        
+        if out is None:
+            return raw.copy()
+        out[:] = raw
+        return out
     
-    def get_present_velocities(self, rad_s=True, ignore=[]):
+    def get_present_velocities(self, rad_s=True, ignore=[], out=None):
         """
         Read present velocities from all servos
         
         Args:
             rad_s: If True, return rad/s; if False, return rev/min
             ignore: List of joint names to ignore
+            out: Optional preallocated float array (one slot per non-ignored
+                joint) filled in place instead of allocating a new one
             
         Returns:
-            NumPy array of velocities
+            NumPy array of velocities (`out` itself when given)
         """
-        present_velocities = []
+        present_velocities = self._vel_buf
+        i = 0
+        synced = self._sync_read_present()
         
-        for joint_name in self.joints.keys():
-            # Skip ignored joints
-            if joint_name in ignore:
-                continue
-            
-            servo_id = self.joints[joint_name]
-            
-            try:
-                # ReadSpeed returns (speed, comm_result, error)
-                servo_speed, comm_result, error = self.packet_handler.ReadSpeed(servo_id)
+        try:
+            for joint_name, servo_id, _ in self._joints_iter:
+                # Skip ignored joints
+                if joint_name in ignore:
+                    continue
                 
-                if comm_result != COMM_SUCCESS:
-                    print(f"Error reading speed from {joint_name}: comm_result={comm_result}")
-                    return None
+                servo_speed = self._synced_word(servo_id, SMS_STS_PRESENT_SPEED_L) if synced else None
+                if servo_speed is None:
+                    # Servo missing from the sync read, ask it directly
+                    # ReadSpeed returns (speed, comm_result, error)
+                    servo_speed, comm_result, error = self.packet_handler.ReadSpeed(servo_id)
+                    if comm_result != COMM_SUCCESS:
+                        logger.warning("Error reading speed from %s: comm_result=%s", joint_name, comm_result)
+                        return None
                 
                 # Speed is in units of rev/min or needs conversion
                 # Waveshare servos typically return speed in a specific format
@@ -358,12 +648,66 @@ class WaveshareHWI:
                 else:
                     velocity = servo_speed
                 
-                present_velocities.append(velocity)
-            except Exception as e:
-                print(f"Exception reading velocity from {joint_name}: {e}")
-                return None
+                present_velocities[i] = velocity
+                i += 1
+        except Exception as e:
+            logger.warning("Exception reading velocity from %s: %s", joint_name, e)
+            return None
+        
+        present_velocities = present_velocities[:i]
+        present_velocities *= 1000.0
+        np.rint(present_velocities, out=present_velocities)
+        present_velocities /= 1000.0
+        if out is None:
+            return present_velocities.copy()
+        out[:] = present_velocities
+        return out
+    
+    def refresh_status(self):
+        """
+        Read voltage, temperature and current of every joint in one sync read
+        
+        Each servo that answers replaces its entry in the status cache, the
+        others keep their previous one.
+        
+        Returns:
+            True if the bus answered the sync read
+        """
+        self._status_time = time.perf_counter()
+        try:
+            if self._sync_read(self._group_status_read) != COMM_SUCCESS:
+                return False
+        except Exception:
+            return False
+        
+        read = self._group_status_read
+        for _, servo_id, _ in self._joints_iter:
+            available, _ = read.isAvailable(servo_id, SMS_STS_PRESENT_VOLTAGE, STATUS_BLOCK_LEN)
+            if not available:
+                continue
+            self._status[servo_id] = (
+                read.getData(servo_id, SMS_STS_PRESENT_VOLTAGE, 1) / 10.0,  # 0.1 V per unit
+                read.getData(servo_id, SMS_STS_PRESENT_TEMPERATURE, 1),
+                self.packet_handler.scs_tohost(read.getData(servo_id, SMS_STS_PRESENT_CURRENT_L, 2), 15),
+            )
+        return True
+    
+    def get_status(self, servo_id, max_age=STATUS_PERIOD):
+        """
+        Cached status of a joint servo, refreshed with one sync read for all
+        joints when the cache is older than `max_age` seconds
         
-        return np.array(np.around(present_velocities, 3))
+        Args:
+            servo_id: Servo ID
+            max_age: Oldest cache (in seconds) to answer from without a refresh
+            
+        Returns:
+            (voltage in volts, temperature in Celsius, raw current), or None if
+            the servo never answered the status sync read
+        """
+        if self._status_time is None or time.perf_counter() - self._status_time > max_age:
+            self.refresh_status()
+        return self._status.get(servo_id)
     
     def read_voltage(self, servo_id):
         """
@@ -375,9 +719,14 @@ class WaveshareHWI:
         Returns:
             Voltage in volts
         """
+        status = self.get_status(servo_id)
+        if status is not None:
+            return status[0]
+        
+        # Not a joint servo (or it missed the sync read), ask it directly
         try:
             voltage, comm_result, error = self.packet_handler.read1ByteTxRx(
-                servo_id, 62  # SMS_STS_PRESENT_VOLTAGE register
+                servo_id, SMS_STS_PRESENT_VOLTAGE
             )
             # Waveshare returns voltage as raw value, convert if needed
             return voltage / 10.0  # Assuming 0.1V per unit
@@ -394,35 +743,46 @@ class WaveshareHWI:
         Returns:
             Temperature in Celsius
         """
+        status = self.get_status(servo_id)
+        if status is not None:
+            return status[1]
+        
+        # Not a joint servo (or it missed the sync read), ask it directly
         try:
             temp, comm_result, error = self.packet_handler.read1ByteTxRx(
-                servo_id, 63  # SMS_STS_PRESENT_TEMPERATURE register
+                servo_id, SMS_STS_PRESENT_TEMPERATURE
             )
             return temp
         except:
             return None
     
-    def scan_servos(self, servo_range=range(1, 250)):
+    def scan_servos(self, servo_range=None, timeout_ms=5):
         """
         Scan for connected servos on the bus
         
         Args:
-            servo_range: Range of IDs to scan
+            servo_range: IDs to scan, defaults to the joint IDs in self.joints
+            timeout_ms: Reply timeout per ID, a missing servo costs this much
             
         Returns:
             List of detected servo IDs
         """
+        if servo_range is None:
+            servo_range = sorted(servo_id for _, servo_id, _ in self._joints_iter)
         detected_ids = []
         print("Scanning for servos...")
         
-        for servo_id in servo_range:
-            try:
-                pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
-                if comm_result == COMM_SUCCESS:
-                    detected_ids.append(servo_id)
-                    print(f"  ✓ Found servo at ID {servo_id}")
-            except:
-                pass
+        # A ping is the shortest transaction, and a missing id gives up after a
+        # few ms instead of the default timeout
+        with short_packet_timeout(self.port_handler, timeout_ms):
+            for servo_id in servo_range:
+                try:
+                    _, comm_result, error = self.packet_handler.ping(servo_id)
+                    if comm_result == COMM_SUCCESS:
+                        detected_ids.append(servo_id)
+                        print(f"  ✓ Found servo at ID {servo_id}")
+                except:
+                    pass
         
         return detected_ids
     
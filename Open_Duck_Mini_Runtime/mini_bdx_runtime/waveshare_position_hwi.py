@@ -3,7 +3,12 @@ import math
 import json
 from typing import Dict, List
 
-from scservo_sdk import PortHandler
+import numpy as np
+from scservo_sdk import PortHandler, GroupSyncRead
+from scservo_sdk.scservo_def import COMM_SUCCESS, INST_SYNC_READ, INST_SYNC_WRITE
+from scservo_sdk.protocol_packet_handler import PKT_ID, PKT_INSTRUCTION, PKT_LENGTH, PKT_PARAMETER0
+
+from mini_bdx_runtime.serial_utils import set_low_latency, use_blocking_reads, short_packet_timeout
 
 try:
     from scservo_sdk import scscl as scscl_module
@@ -15,6 +20,21 @@ try:
 except Exception:
     sms_sts_module = None
 
+try:
+    # the compiled conversions (see setup.py), same results as the Python ones
+    from mini_bdx_runtime import _servo_math
+except ImportError:
+    _servo_math = None
+
+
+# Present position/speed/load block, same addresses on scscl and sms_sts
+PRESENT_POSITION_ADDR = 56
+PRESENT_SPEED_ADDR = 58
+PRESENT_BLOCK_LEN = 6
+# Broadcast id the servos act on; the SDK's BROADCAST_ID (0xFF) isn't one, so
+# its sync read/write packets would never reach them
+SERVO_BROADCAST_ID = 0xFE
+
 
 def clamp(v, a, b):
     return max(a, min(b, v))
@@ -39,6 +59,8 @@ class WaveshareHWI:
         self.port = PortHandler(self.serial_port)
         self.port.openPort()
         self.port.setBaudRate(self.baudrate)
+        set_low_latency(self.port)
+        use_blocking_reads(self.port)
 
         if self.protocol == "sms_sts":
             packet_cls = sms_sts_module.sms_sts if sms_sts_module else None
@@ -53,20 +75,53 @@ class WaveshareHWI:
         # Default resolution parameters (SC family)
         # counts_per_pi: counts that represent π radians (180°)
         self.counts_per_pi = getattr(duck_config, "counts_per_pi", 1024)
+        self._center = self.counts_per_pi // 2
+        self._scale = self.counts_per_pi / (2 * math.pi)
+        self._max_count = self.counts_per_pi - 1
 
         # joint mapping & init_pos expected in duck_config
         self.joints = getattr(duck_config, "joint_map", {})
         self.init_pos = getattr(duck_config, "init_pos", {})
 
+        # Joints sorted by name once, every per-tick loop walks these
+        items = sorted(self.joints.items())
+        self._sorted_names = tuple(name for name, _ in items)
+        self._sorted_ids = tuple(sid for _, sid in items)
+
+        # One sync read returns position + speed + load of every joint
+        self._sync_read = GroupSyncRead(self.packet, PRESENT_POSITION_ADDR, PRESENT_BLOCK_LEN)
+        for sid in self._sorted_ids:
+            self._sync_read.addParam(sid)
+
     def rad_to_servo_pos(self, rad: float) -> int:
         # Map radians to servo counts. rad==0 maps to center.
-        center = int(self.counts_per_pi / 2)
-        pos = int((rad / math.pi) * (self.counts_per_pi / 2) + center)
-        return clamp(pos, 0, self.counts_per_pi - 1)
+        if _servo_math is not None:
+            return _servo_math.rad_to_servo_pos(rad, self._center, self._scale, self._max_count)
+        pos = int(rad * self._scale + self._center)
+        return 0 if pos < 0 else (self._max_count if pos > self._max_count else pos)
 
     def servo_pos_to_rad(self, count: int) -> float:
-        center = int(self.counts_per_pi / 2)
-        return (count - center) * math.pi / (self.counts_per_pi / 2)
+        if _servo_math is not None:
+            return _servo_math.servo_pos_to_rad(count, self._center, self._scale)
+        return (count - self._center) / self._scale
+
+    def rad_to_servo_pos_batch(self, rads) -> np.ndarray:
+        # Vectorized rad_to_servo_pos, one numpy pass for all joints
+        rads = np.ascontiguousarray(rads, dtype=np.float64)
+        if _servo_math is not None:
+            out = np.empty(rads.shape[0], dtype=np.intc)
+            _servo_math.rad_to_servo_pos_batch(rads, out, self._center, self._scale, self._max_count)
+            return out
+        counts = (rads * self._scale + self._center).astype(np.int32)
+        return np.clip(counts, 0, self._max_count)
+
+    def servo_pos_to_rad_batch(self, counts) -> np.ndarray:
+        if _servo_math is not None:
+            counts = np.ascontiguousarray(counts, dtype=np.intc)
+            out = np.empty(counts.shape[0], dtype=np.float64)
+            _servo_math.servo_pos_to_rad_batch(counts, out, self._center, self._scale)
+            return out
+        return (np.asarray(counts, dtype=np.float64) - self._center) / self._scale
 
     def set_kps(self, kps: List[float]):
         # Not implemented: store for compatibility
@@ -77,14 +132,14 @@ class WaveshareHWI:
 
     def turn_on(self):
         # Enable torque for all known joints (if supported)
-        for name, sid in self.joints.items():
+        for sid in self._sorted_ids:
             try:
                 self.packet.write1ByteTxRx(sid, 24, 1)  # torque enable register (common)
             except Exception:
                 pass
 
     def turn_off(self):
-        for name, sid in self.joints.items():
+        for sid in self._sorted_ids:
             try:
                 self.packet.write1ByteTxRx(sid, 24, 0)
             except Exception:
@@ -92,57 +147,115 @@ class WaveshareHWI:
 
     def set_position_all(self, joints_dict: Dict[str, float], speed: int = 500, acc: int = 30):
         # joints_dict: {joint_name: rad}
+        # All targets go out in a single sync write packet (no status replies)
+        sync_write = self.packet.groupSyncWrite
+        sync_write.clearParam()
+        ids = []
+        rads = []
         for name, rad in joints_dict.items():
             sid = self.joints.get(name)
             if sid is None:
                 continue
-            pos = self.rad_to_servo_pos(rad)
+            ids.append(sid)
+            rads.append(rad)
+        for sid, pos in zip(ids, self.rad_to_servo_pos_batch(rads).tolist()):
             if self.protocol == "sms_sts":
-                # ST family
-                self.packet.WritePosEx(sid, pos, speed, acc)
+                # ST family: acc, position, time, speed
+                self.packet.SyncWritePosEx(sid, pos, speed, acc)
             else:
-                # SC family: WritePos(id, position, time_ms, speed)
+                # SC family: position, time, speed
                 # use time=0 for immediate, speed is 0-3000
-                self.packet.WritePos(sid, pos, 0, speed)
+                self.packet.SyncWritePos(sid, pos, 0, speed)
+        # Same as sync_write.txPacket(), addressed to SERVO_BROADCAST_ID
+        if sync_write.data_dict:
+            sync_write.makeParam()
+            self._broadcast(
+                INST_SYNC_WRITE, [sync_write.start_address, sync_write.data_length] + sync_write.param
+            )
+        sync_write.clearParam()
+
+    def _broadcast(self, instruction, params):
+        """Send one instruction packet to SERVO_BROADCAST_ID, no status reply."""
+        txpacket = [0] * (len(params) + 6)
+        txpacket[PKT_ID] = SERVO_BROADCAST_ID
+        txpacket[PKT_LENGTH] = len(params) + 2
+        txpacket[PKT_INSTRUCTION] = instruction
+        txpacket[PKT_PARAMETER0:PKT_PARAMETER0 + len(params)] = params
+        result = self.packet.txPacket(txpacket)
+        self.port.is_using = False
+        return result
+
+    def _sync_read_present(self):
+        """Refresh the present position/speed block of all joints in one transaction.
+
+        Returns False if the bus (or servo family) doesn't answer the sync read.
+        """
+        # Same as self._sync_read.txRxPacket(), with the request sent to
+        # SERVO_BROADCAST_ID instead of the SDK's BROADCAST_ID
+        read = self._sync_read
+        try:
+            if read.is_param_changed or not read.param:
+                read.makeParam()
+            params = [read.start_address, read.data_length] + read.param
+            if self._broadcast(INST_SYNC_READ, params) != COMM_SUCCESS:
+                return False
+            return read.rxPacket() == COMM_SUCCESS
+        except Exception:
+            return False
+
+    def _synced_word(self, sid, addr):
+        available, _ = self._sync_read.isAvailable(sid, addr, 2)
+        if not available:
+            return None
+        return self.packet.scs_tohost(self._sync_read.getData(sid, addr, 2), 15)
 
     def get_present_positions(self, ignore: List[str] = None):
         ignore = ignore or []
+        synced = self._sync_read_present()
         out = []
-        for name in sorted(self.joints.keys()):
+        for name, sid in zip(self._sorted_names, self._sorted_ids):
             if name in ignore:
                 continue
-            sid = self.joints[name]
-            try:
-                pos, _, _ = self.packet.ReadPos(sid)
-                out.append(self.servo_pos_to_rad(pos))
-            except Exception:
-                out.append(0.0)
+            pos = self._synced_word(sid, PRESENT_POSITION_ADDR) if synced else None
+            if pos is None:
+                try:
+                    pos, _, _ = self.packet.ReadPos(sid)
+                except Exception:
+                    out.append(0.0)
+                    continue
+            out.append(self.servo_pos_to_rad(pos))
         return out
 
     def get_present_velocities(self, ignore: List[str] = None):
         ignore = ignore or []
+        synced = self._sync_read_present()
         out = []
-        for name in sorted(self.joints.keys()):
+        for name, sid in zip(self._sorted_names, self._sorted_ids):
             if name in ignore:
                 continue
-            sid = self.joints[name]
-            try:
-                spd, _, _ = self.packet.ReadSpeed(sid)
-                # conversion to rad/s is hardware-specific; leave raw scaled
-                out.append(spd)
-            except Exception:
-                out.append(0.0)
+            spd = self._synced_word(sid, PRESENT_SPEED_ADDR) if synced else None
+            if spd is None:
+                try:
+                    spd, _, _ = self.packet.ReadSpeed(sid)
+                except Exception:
+                    out.append(0.0)
+                    continue
+            # conversion to rad/s is hardware-specific; leave raw scaled
+            out.append(spd)
         return out
 
-    def scan_servos(self, id_range=range(1, 255)):
+    def scan_servos(self, id_range=range(1, 255), timeout_ms: float = 5):
+        # Feetech servos don't answer a broadcast ping, so probe each id but
+        # give up on a missing one after a few ms instead of the default timeout
         found = []
-        for sid in id_range:
-            try:
-                _, res, err = self.packet.ReadPos(sid)
-                if res == 0:
-                    found.append(sid)
-            except Exception:
-                pass
+        with short_packet_timeout(self.port, timeout_ms):
+            for sid in id_range:
+                try:
+                    _, res, _ = self.packet.ping(sid)
+                    if res == COMM_SUCCESS:
+                        found.append(sid)
+                except Exception:
+                    pass
         return found
 
     def close(self):
@@ -3,12 +3,14 @@ Debug script to check all motors in the robot.
 Verifies each motor is accessible and allows testing movement.
 """
 
+import sys
 import time
 import numpy as np
 import traceback
 import argparse
 
 from mini_bdx_runtime.duck_config import DuckConfig
+from mini_bdx_runtime.serial_utils import cap_packet_timeout
 
 try:
     from mini_bdx_runtime.rustypot_position_hwi import HWI as RustypotHWI
@@ -20,10 +22,14 @@ try:
 except Exception:
     WaveshareHWI = None
 
+# Healthy servos answer a probe within a few ms, a missing one costs at most this
+PACKET_TIMEOUT_MS = 20
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--duck_config_path", type=str, default=None)
     parser.add_argument("--serial_port", type=str, default=None)
+    parser.add_argument("--verbose", action="store_true", help="Print per-motor progress and tracebacks")
     args = parser.parse_args()
 
     print("Initializing hardware interface...")
@@ -52,6 +58,15 @@ def main():
         print("Check that the robot is powered on and connection parameters are correct.")
         return
 
+    # Don't wait the SDK's default timeout on every missing servo
+    port = getattr(hwi, "port", None) or getattr(hwi, "port_handler", None)
+    if hasattr(port, "setPacketTimeoutMillis"):
+        cap_packet_timeout(port, PACKET_TIMEOUT_MS)
+
+    # Joint order never changes, build the lookups once
+    joint_items = list(hwi.joints.items())
+    name_to_idx = {name: i for i, (name, _) in enumerate(joint_items)}
+
     # Try to enable torque globally if supported
     print("\nTurning on motors (best-effort)...")
     unresponsive_motors = []
@@ -60,7 +75,7 @@ def main():
             hwi.turn_on()
         elif hasattr(hwi, "io") and hasattr(hwi.io, "enable_torque"):
             # rustypot-like API
-            for jname, jid in hwi.joints.items():
+            for jname, jid in joint_items:
                 try:
                     hwi.io.enable_torque([jid])
                 except Exception:
@@ -68,66 +83,96 @@ def main():
     except Exception:
         pass
 
-    # Per-motor low-torque attempt (best-effort)
-    for joint_name, joint_id in hwi.joints.items():
-        try:
-            print(f"Setting low torque for motor '{joint_name}' (ID: {joint_id})...")
-            if hasattr(hwi, "set_kps"):
-                # WaveshareHWI compatibility
-                hwi.set_kps([30] * len(hwi.joints))
-                print(f"✓ Low torque (kps) set for '{joint_name}'")
-            elif hasattr(hwi, "io") and hasattr(hwi.io, "set_kps"):
-                hwi.io.set_kps([joint_id], [10])
-                print(f"✓ Low torque set successfully for motor '{joint_name}' (ID: {joint_id}).")
-        except Exception as e:
-            print(f"✗ Error setting low torque for motor '{joint_name}' (ID: {joint_id}): {e}")
+    # Low torque for all motors at once (best-effort)
+    print("Setting low torque for all motors...")
+    try:
+        if hasattr(hwi, "set_kps"):
+            # WaveshareHWI compatibility
+            hwi.set_kps([30] * len(joint_items))
+            print("✓ Low torque (kps) set for all motors")
+        elif hasattr(hwi, "io") and hasattr(hwi.io, "set_kps"):
+            hwi.io.set_kps([joint_id for _, joint_id in joint_items], [10] * len(joint_items))
+            print("✓ Low torque set successfully for all motors.")
+    except Exception as e:
+        print(f"✗ Error setting low torque: {e}")
+        if args.verbose:
             print(f"Error details: {traceback.format_exc()}")
-            unresponsive_motors.append((joint_name, joint_id))
+        if hasattr(hwi, "set_kps"):
+            unresponsive_motors.extend(joint_items)
+        else:
+            # Retry one by one to find out which motors are failing
+            for joint_name, joint_id in joint_items:
+                try:
+                    hwi.io.set_kps([joint_id], [10])
+                except Exception as e:
+                    print(f"✗ Error setting low torque for motor '{joint_name}' (ID: {joint_id}): {e}")
+                    unresponsive_motors.append((joint_name, joint_id))
     
     # Check if all motors are responsive
     print("\nChecking if all motors are responsive...")
-    
-    for joint_name, joint_id in hwi.joints.items():
+
+    positions_snapshot = []
+
+    def present_positions():
+        # A single get_present_positions() read shared by every probe
+        if not positions_snapshot:
+            positions_snapshot.append(hwi.get_present_positions())
+        return positions_snapshot[0]
+
+    def probe(joint_name, joint_id):
+        # Try to read the position to check if motor is responsive
+        pos_val = None
+        # Waveshare packet
+        if hasattr(hwi, "packet"):
+            try:
+                p, _, _ = hwi.packet.ReadPos(joint_id)
+                pos_val = p
+            except Exception:
+                pos_val = None
+        # HWI wrapper method
+        if pos_val is None and hasattr(hwi, "get_present_positions"):
+            try:
+                pos_val = present_positions()[name_to_idx[joint_name]]
+            except Exception:
+                pos_val = None
+        # rustypot io
+        if pos_val is None and hasattr(hwi, "io") and hasattr(hwi.io, "read_present_position"):
+            try:
+                pos_val = hwi.io.read_present_position([joint_id])[0]
+            except Exception:
+                pos_val = None
+
+        if pos_val is None:
+            raise RuntimeError("Could not read position")
+        return pos_val
+
+    # Output of the probe loop is collected and written once at the end
+    out = []
+    to_probe = []
+    for joint_name, joint_id in joint_items:
         # Skip motors that already failed
         if (joint_name, joint_id) in unresponsive_motors:
-            print(f"Skipping previously unresponsive motor: '{joint_name}' (ID: {joint_id})")
+            out.append(f"Skipping previously unresponsive motor: '{joint_name}' (ID: {joint_id})")
             continue
+        to_probe.append((joint_name, joint_id))
 
-        print(f"Attempting to read position from motor '{joint_name}' (ID: {joint_id})...")
+    # Probes run inline, one at a time on the port: the Waveshare port is capped
+    # to PACKET_TIMEOUT_MS above and rustypot has its own serial timeout, so a
+    # missing servo can't stall the script
+    for joint_name, joint_id in to_probe:
+        if args.verbose:
+            out.append(f"Attempting to read position from motor '{joint_name}' (ID: {joint_id})...")
         try:
-            # Try to read the position to check if motor is responsive
-            pos_val = None
-            # Waveshare packet
-            if hasattr(hwi, "packet"):
-                try:
-                    p, _, _ = hwi.packet.ReadPos(joint_id)
-                    pos_val = p
-                except Exception:
-                    pos_val = None
-            # HWI wrapper method
-            if pos_val is None and hasattr(hwi, "get_present_positions"):
-                try:
-                    pos_list = hwi.get_present_positions()
-                    keys = list(hwi.joints.keys())
-                    idx = keys.index(joint_name)
-                    pos_val = pos_list[idx]
-                except Exception:
-                    pos_val = None
-            # rustypot io
-            if pos_val is None and hasattr(hwi, "io") and hasattr(hwi.io, "read_present_position"):
-                try:
-                    pos_val = hwi.io.read_present_position([joint_id])[0]
-                except Exception:
-                    pos_val = None
-
-            if pos_val is None:
-                raise RuntimeError("Could not read position")
-
-            print(f"✓ Motor '{joint_name}' (ID: {joint_id}) is responsive. Position: {pos_val}")
+            pos_val = probe(joint_name, joint_id)
+            out.append(f"✓ Motor '{joint_name}' (ID: {joint_id}) is responsive. Position: {pos_val}")
         except Exception as e:
-            print(f"✗ Error accessing motor '{joint_name}' (ID: {joint_id}): {e}")
-            print(f"Error details for motor {joint_id}: {traceback.format_exc()}")
+            out.append(f"✗ Error accessing motor '{joint_name}' (ID: {joint_id}): {e}")
+            if args.verbose:
+                out.append(f"Error details for motor {joint_id}: {traceback.format_exc()}")
             unresponsive_motors.append((joint_name, joint_id))
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
     if unresponsive_motors:
         print("\nWARNING: Some motors are not responsive!")
@@ -137,7 +182,7 @@ def main():
             print("Exiting...")
             try:
                 print("Attempting to turn off responsive motors before exiting...")
-                for joint_name, joint_id in hwi.joints.items():
+                for joint_name, joint_id in joint_items:
                     if (joint_name, joint_id) not in unresponsive_motors:
                         try:
                             if hasattr(hwi, "turn_off"):
@@ -156,7 +201,7 @@ def main():
     print("This will move each motor by a small amount to check if it's working correctly.")
     input("Press Enter to begin the movement test...")
     
-    for joint_name, joint_id in hwi.joints.items():
+    for joint_name, joint_id in joint_items:
         # Skip unresponsive motors
         if (joint_name, joint_id) in unresponsive_motors:
             print(f"Skipping unresponsive motor: '{joint_name}' (ID: {joint_id})")
@@ -180,10 +225,7 @@ def main():
                 cur_count, _, _ = hwi.packet.ReadPos(joint_id)
                 current_position = hwi.servo_pos_to_rad(cur_count) if hasattr(hwi, "servo_pos_to_rad") else cur_count
             elif hasattr(hwi, "get_present_positions"):
-                plist = hwi.get_present_positions()
-                keys = list(hwi.joints.keys())
-                idx = keys.index(joint_name)
-                current_position = plist[idx]
+                current_position = hwi.get_present_positions()[name_to_idx[joint_name]]
             elif hasattr(hwi, "io") and hasattr(hwi.io, "read_present_position"):
                 current_position = hwi.io.read_present_position([joint_id])[0]
             else:
@@ -235,22 +277,28 @@ def main():
 
         except Exception as e:
             print(f"Error testing motor '{joint_name}' (ID: {joint_id}): {e}")
-            print(f"Error details: {traceback.format_exc()}")
+            if args.verbose:
+                print(f"Error details: {traceback.format_exc()}")
     
     # Turn off motors
     print("\nTurning off motors one by one...")
-    for joint_name, joint_id in hwi.joints.items():
+    out = []
+    for joint_name, joint_id in joint_items:
         if (joint_name, joint_id) in unresponsive_motors:
-            print(f"Skipping turning off unresponsive motor: '{joint_name}' (ID: {joint_id})")
+            out.append(f"Skipping turning off unresponsive motor: '{joint_name}' (ID: {joint_id})")
             continue
             
         try:
-            print(f"Disabling torque for motor '{joint_name}' (ID: {joint_id})...")
+            if args.verbose:
+                out.append(f"Disabling torque for motor '{joint_name}' (ID: {joint_id})...")
             hwi.io.disable_torque([joint_id])
-            print(f"✓ Motor '{joint_name}' (ID: {joint_id}) turned off successfully.")
+            out.append(f"✓ Motor '{joint_name}' (ID: {joint_id}) turned off successfully.")
         except Exception as e:
-            print(f"✗ Error turning off motor '{joint_name}' (ID: {joint_id}): {e}")
-            print(f"Error details: {traceback.format_exc()}")
+            out.append(f"✗ Error turning off motor '{joint_name}' (ID: {joint_id}): {e}")
+            if args.verbose:
+                out.append(f"Error details: {traceback.format_exc()}")
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\nMotor test completed.")
 
@@ -3,6 +3,11 @@ import math
 import shutil
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 DUCK_CONFIG = ROOT / "duck_config.json"
 CALIB_PATHS = [
@@ -18,8 +23,13 @@ def find_calib():
     return None
 
 def load_json(p):
-    with open(p, "r") as f:
-        return json.load(f)
+    return orjson.loads(Path(p).read_bytes()) if orjson else json.loads(Path(p).read_text())
+
+def save_json(p, obj):
+    if orjson:
+        Path(p).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        Path(p).write_text(json.dumps(obj, indent=2))
 
 def main():
     if not DUCK_CONFIG.exists():
@@ -33,35 +43,35 @@ def main():
         return
 
     cfg = load_json(DUCK_CONFIG)
-    data = load_json(calib)
+    # JSON keys are always strings, normalize to servo ids once
+    data = {int(k): v for k, v in load_json(calib).items()}
 
     counts_per_pi = cfg.get("counts_per_pi", 1024)
     center = counts_per_pi // 2
+    factor = math.pi / (counts_per_pi / 2)
 
     joint_map = cfg.get("joint_map", {})
-    init_pos = cfg.get("init_pos", {})
-
-    # backup
-    shutil.copy(DUCK_CONFIG, DUCK_CONFIG.with_suffix(".json.bak"))
+    old_init_pos = cfg.get("init_pos", {})
+    init_pos = dict(old_init_pos)
 
     updated = 0
     for joint, sid in joint_map.items():
-        # keys in calibration file might be strings
-        c = None
-        if str(sid) in data:
-            c = data[str(sid)]
-        elif sid in data:
-            c = data[sid]
+        c = data.get(int(sid))
         if c is None:
             continue
         # compute radians
-        rad = (c - center) * math.pi / (counts_per_pi / 2)
-        init_pos[joint] = float(rad)
+        init_pos[joint] = float((c - center) * factor)
         updated += 1
 
+    if init_pos == old_init_pos:
+        print(f"init_pos in {DUCK_CONFIG} already matches the calibration, nothing to do")
+        return
+
+    # backup
+    shutil.copy(DUCK_CONFIG, DUCK_CONFIG.with_suffix(".json.bak"))
+
     cfg["init_pos"] = init_pos
-    with open(DUCK_CONFIG, "w") as f:
-        json.dump(cfg, f, indent=2)
+    save_json(DUCK_CONFIG, cfg)
 
     print(f"Updated {updated} joints in {DUCK_CONFIG}; backup saved as .json.bak")
 
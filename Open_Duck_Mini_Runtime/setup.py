@@ -0,0 +1,24 @@
+from setuptools import Extension, setup
+
+# Metadata lives in setup.cfg, this only adds the optional compiled helpers.
+# Without Cython (or a compiler) the pure Python code paths are used. Cython
+# isn't a build requirement, to build the helpers install it and then
+# `pip install --no-build-isolation .`
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "mini_bdx_runtime._servo_math",
+                ["mini_bdx_runtime/mini_bdx_runtime/_servo_math.pyx"],
+                extra_compile_args=["-O3"],
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,42 @@
+"""Put the Waveshare SDK on sys.path for the sms_sts bench scripts."""
+import functools
+import os
+import sys
+
+# Try a couple of sensible relative locations
+BASE = os.path.dirname(__file__)
+CANDIDATE_PATHS = [
+    os.path.join(BASE, "..", "..", "STServo_Python", "stservo-env"),
+    os.path.join(BASE, "..", "..", "..", "STServo_Python", "stservo-env"),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_sdk_on_path():
+    """Find the SDK directory and prepend it to sys.path, once per process.
+
+    Returns the path that was added, or None if none of the candidates exist.
+    """
+    for p in CANDIDATE_PATHS:
+        p = os.path.normpath(p)
+        if os.path.exists(p):
+            sys.path.insert(0, p)
+            return p
+    return None
+
+
+SDK_PATH = ensure_sdk_on_path()
+
+
+def load_scscl():
+    """Return the SC packet handler class.
+
+    The package star-exports the class under the submodule's name, so import
+    it from the submodule directly. Raises ImportError if the SDK is missing,
+    callers report that themselves.
+    """
+    try:
+        from scservo_sdk.scscl import scscl
+    except ImportError:
+        from scservo_sdk import scscl
+    return scscl
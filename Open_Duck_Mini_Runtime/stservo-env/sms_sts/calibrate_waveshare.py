@@ -3,81 +3,131 @@
 Produces a JSON mapping of ``id -> observed_count`` which can be used to
 compute offsets for `duck_config.json` or a separate calibration file.
 """
-import time
 import json
-import os
+import argparse
 import sys
 
-# Add SDK paths (try a couple of sensible relative locations)
-BASE = os.path.dirname(__file__)
-candidate_paths = [
-    os.path.join(BASE, "..", "..", "STServo_Python", "stservo-env"),
-    os.path.join(BASE, "..", "..", "..", "STServo_Python", "stservo-env"),
-]
-SDK_PATH = None
-for p in candidate_paths:
-    p = os.path.normpath(p)
-    if os.path.exists(p):
-        SDK_PATH = p
-        break
-if SDK_PATH:
-    sys.path.insert(0, SDK_PATH)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from _sdk_bootstrap import ensure_sdk_on_path, load_scscl
+
+SDK_PATH = ensure_sdk_on_path()
 
 try:
-    from scservo_sdk import PortHandler, sms_sts, scscl
-    from scservo_sdk.scservo_def import COMM_SUCCESS, COMM_RX_TIMEOUT
+    Scscl = load_scscl()
+    from scservo_sdk import PortHandler
+    from scservo_sdk.scservo_def import COMM_SUCCESS
 except ImportError as e:
     print(f"ERROR: Could not import scservo_sdk: {e}")
     print(f"Tried SDK path: {SDK_PATH}")
     print("Make sure Waveshare SDK is in Python path or activate the stservo-env virtualenv.")
     sys.exit(1)
 
+from port_utils import set_low_latency, short_packet_timeout, use_blocking_reads, wait_stop
+
 PORT = "COM5"
 BAUD = 1000000
 
+# Duck joint ids, pinged at each baud rate until one answers
+PROBE_IDS = [10, 11, 12, 13, 14, 20, 21, 22, 23, 24, 30, 31, 32, 33]
+# Tried in order after --baud when none of the probe ids answer
+FALLBACK_BAUDS = [1000000, 500000, 115200]
+
+# Counts a centered servo may read away from the goal and still be saved
+CENTER_TOLERANCE = 16
+
+def open_bus(port, packet, baud, probe_ids):
+    """Set the first baud rate at which one of `probe_ids` answers a ping.
+
+    Returns that baud rate, or None (port left at `baud`) if nothing answered.
+    """
+    bauds = [baud] + [b for b in FALLBACK_BAUDS if b != baud]
+    for b in bauds:
+        if not port.setBaudRate(b):
+            continue
+        set_low_latency(port)
+        # Missing ids give up after 5 ms, the scan below uses the same timeout
+        with short_packet_timeout(port, 5):
+            for sid in probe_ids:
+                _, res, _ = packet.ping(sid)
+                if res == COMM_SUCCESS:
+                    return b
+    port.setBaudRate(baud)
+    set_low_latency(port)
+    return None
+
 def main():
-    port = PortHandler(PORT)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", default=PORT)
+    parser.add_argument("--baud", type=int, default=BAUD)
+    parser.add_argument("--probe_ids", type=int, nargs="+", default=PROBE_IDS,
+                        help="servos pinged to check the baud rate")
+    args = parser.parse_args()
+
+    port = PortHandler(args.port)
     port.openPort()
-    port.setBaudRate(BAUD)
+    use_blocking_reads(port)
+    packet = Scscl(port)
 
-    # `scscl` may be the module (with class `scscl`) or the class itself depending
-    # on how scservo_sdk.__init__ exported symbols. Handle both cases.
-    if hasattr(scscl, "scscl"):
-        ScsclClass = scscl.scscl
+    baud = open_bus(port, packet, args.baud, args.probe_ids)
+    if baud is None:
+        print(f"No answer from servos {args.probe_ids} at any baud rate, staying at {args.baud}")
     else:
-        ScsclClass = scscl
-    packet = ScsclClass(port)
+        print(f"Bus running at {baud} baud")
 
     found = []
     print("Scanning IDs 1-50 for present servos...")
-    for sid in range(1, 51):
-        try:
-            _, res, err = packet.ReadPos(sid)
-            if res == 0:
-                found.append(sid)
-        except Exception:
-            pass
+    # Servos can't share a broadcast ping reply, so ping each id but give up on
+    # a missing one after 5 ms instead of the SDK default
+    with short_packet_timeout(port, 5):
+        for sid in range(1, 51):
+            try:
+                _, res, err = packet.ping(sid)
+                if res == COMM_SUCCESS:
+                    found.append(sid)
+            except Exception:
+                pass
 
     print(f"Found servos: {found}")
 
-    results = {}
+    # Acknowledged write per servo: the SDK's sync write is addressed to 0xFF,
+    # which the servos don't treat as broadcast
+    center = 512
+    moved = []
     for sid in found:
-        center = 512
-        try:
-            packet.WritePos(sid, center, 0, 500)
-        except Exception as e:
-            print(f"WritePos failed for {sid}: {e}")
-            continue
-        time.sleep(0.8)
+        res, _ = packet.WritePos(sid, center, 0, 500)
+        if res == COMM_SUCCESS:
+            moved.append(sid)
+        else:
+            print(f"WritePos failed for {sid}")
+    if moved:
+        wait_stop(packet, moved, timeout=0.8)
+
+    results = {}
+    for sid in moved:
         try:
-            pos, _, _ = packet.ReadPos(sid)
+            pos, res, _ = packet.ReadPos(sid)
+            if res != COMM_SUCCESS:
+                print(f"ReadPos failed for {sid}")
+                continue
+            if abs(pos - center) > CENTER_TOLERANCE:
+                print(f"Servo {sid} did not reach center (observed {pos}), not saved")
+                continue
             results[sid] = pos
             print(f"Servo {sid} -> observed {pos}")
         except Exception as e:
             print(f"ReadPos failed for {sid}: {e}")
 
-    with open("waveshare_calibration.json", "w") as f:
-        json.dump(results, f, indent=2)
+    if orjson:
+        # servo ids are int keys, same output as json.dump
+        with open("waveshare_calibration.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open("waveshare_calibration.json", "w") as f:
+            json.dump(results, f, indent=2)
 
     print("Saved waveshare_calibration.json")
     port.closePort()
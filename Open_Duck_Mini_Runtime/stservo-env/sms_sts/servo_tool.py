@@ -0,0 +1,103 @@
+"""Bench tool for a single SC servo: register dump, torque on/off, move.
+
+    python servo_tool.py diag  [--id 21]
+    python servo_tool.py torque [--id 21] [--off]
+    python servo_tool.py move  [--id 21] [--target 512] [--time_ms 300] [--speed 1000]
+
+diag_servo.py, enable_torque.py and move_servo.py are shims for the
+matching subcommand.
+"""
+import time
+import argparse
+import sys
+
+from _sdk_bootstrap import ensure_sdk_on_path, load_scscl
+
+SDK_PATH = ensure_sdk_on_path()
+
+try:
+    Scscl = load_scscl()
+    from scservo_sdk import PortHandler
+except ImportError as e:
+    print(f"ERROR: Could not import scservo_sdk: {e}")
+    print(f"Tried SDK path: {SDK_PATH}")
+    print("Make sure Waveshare SDK is in Python path or activate the stservo-env virtualenv.")
+    sys.exit(1)
+
+from port_utils import set_low_latency, use_blocking_reads
+
+
+def cmd_diag(pkt, sid):
+    # Two block reads instead of six round-trips
+    limits, _, _ = pkt.readTxRx(sid, 9, 4)           # min limit (9-10), max limit (11-12)
+    state, _, _ = pkt.readTxRx(sid, 40, 27)          # torque enable (40) .. moving (66)
+
+    def word(data, off):
+        if len(data) < off + 2:
+            return None
+        return pkt.scs_makeword(data[off], data[off + 1])
+
+    min_limit = word(limits, 0)
+    max_limit = word(limits, 2)
+    torque = state[0] if state else None
+    pos = word(state, 16)                            # present position (56)
+    spd = word(state, 18)                            # present speed (58)
+    if spd is not None:
+        spd = pkt.scs_tohost(spd, 15)
+    moving = state[26] if len(state) > 26 else None  # moving (66)
+
+    print(f"ID {sid}: torque={torque} min={min_limit} max={max_limit} pos={pos} spd={spd} moving={moving}")
+
+
+def cmd_torque(pkt, sid, on=True):
+    pkt.write1ByteTxRx(sid, 40, 1 if on else 0)   # write torque enable
+    print(f"{'Enabled' if on else 'Disabled'} torque on {sid}")
+
+
+def cmd_move(pkt, sid, target=512, time_ms=300, speed=1000):
+    # target count (512 = center), duration in ms, speed 0-3000 approx
+    pkt.WritePos(sid, target, time_ms, speed)
+    time.sleep(max(0.8, time_ms/1000.0 + 0.5))
+
+    print("ReadPos:", pkt.ReadPos(sid))
+    print("ReadPosSpeed:", pkt.ReadPosSpeed(sid))
+    print("ReadMoving:", pkt.ReadMoving(sid))
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--port", default="COM5")
+    common.add_argument("--baud", type=int, default=1000000)
+    common.add_argument("--id", type=int, default=21, help="servo id to test")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("diag", parents=[common], help="dump torque/limits/position/speed/moving")
+    torque = sub.add_parser("torque", parents=[common], help="enable (or --off disable) torque")
+    torque.add_argument("--off", action="store_true")
+    move = sub.add_parser("move", parents=[common], help="move to a position and read it back")
+    move.add_argument("--target", type=int, default=512)
+    move.add_argument("--time_ms", type=int, default=300)
+    move.add_argument("--speed", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    p = PortHandler(args.port)
+    p.openPort()
+    p.setBaudRate(args.baud)
+    set_low_latency(p)
+    use_blocking_reads(p)
+    pkt = Scscl(p)
+
+    try:
+        if args.cmd == "diag":
+            cmd_diag(pkt, args.id)
+        elif args.cmd == "torque":
+            cmd_torque(pkt, args.id, not args.off)
+        elif args.cmd == "move":
+            cmd_move(pkt, args.id, args.target, args.time_ms, args.speed)
+    finally:
+        p.closePort()
+
+
+if __name__ == "__main__":
+    main()
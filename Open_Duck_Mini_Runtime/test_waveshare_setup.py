@@ -16,6 +16,7 @@ import sys
 import os
 import time
 import argparse
+from contextlib import nullcontext
 import numpy as np
 
 # Add SDK paths
@@ -29,14 +30,41 @@ if os.path.exists(SDK_PATH):
     sys.path.insert(0, SDK_PATH)
 
 try:
-    from scservo_sdk import PortHandler, sms_sts, scscl
-    from scservo_sdk.scservo_def import COMM_SUCCESS, COMM_RX_TIMEOUT
+    from scservo_sdk import PortHandler, GroupSyncRead, sms_sts, scscl
+    from scservo_sdk.scservo_def import COMM_SUCCESS, COMM_RX_TIMEOUT, INST_SYNC_READ, INST_SYNC_WRITE
+    from scservo_sdk.protocol_packet_handler import PKT_ID, PKT_INSTRUCTION, PKT_LENGTH, PKT_PARAMETER0
 except ImportError as e:
     print(f"ERROR: Could not import scservo_sdk: {e}")
     print(f"SDK path: {SDK_PATH}")
     print("Make sure Waveshare SDK is in Python path.")
     sys.exit(1)
 
+# USB-serial latency and blocking read helpers: next to the script in sms_sts,
+# otherwise the runtime package's copy
+try:
+    from port_utils import set_low_latency, short_packet_timeout, use_blocking_reads
+except ImportError:
+    try:
+        from mini_bdx_runtime.serial_utils import set_low_latency, short_packet_timeout, use_blocking_reads
+    except ImportError:
+        set_low_latency = short_packet_timeout = use_blocking_reads = None
+
+# Present position register, same address for SC and ST servos
+PRESENT_POSITION_ADDR = 56
+# The sync read length byte is id count + 4, so at most 251 ids per packet
+SYNC_READ_BATCH = 127
+# Broadcast id the servos act on; the SDK's BROADCAST_ID (0xFF) isn't one
+SERVO_BROADCAST_ID = 0xFE
+# Min angle limit (9) through present position (56-57), read in one go
+REG_BLOCK_START = 9
+REG_BLOCK_LEN = PRESENT_POSITION_ADDR + 2 - REG_BLOCK_START
+# Per-ID reply timeout (ms) for the ping scan, a status packet takes well under 1 ms
+SCAN_TIMEOUT_MS = 5
+# Reply timeout (ms) for the position readback after a move
+READBACK_TIMEOUT_MS = 200
+# ReadMoving poll intervals (s) once a move should be nearly done, the last repeats
+POLL_BACKOFF = (0.02, 0.04, 0.08, 0.15)
+
 
 class WaveshareTest:
     def __init__(self, port, baudrate=1000000, protocol="sms_sts"):
@@ -46,6 +74,10 @@ class WaveshareTest:
         self.port_handler = None
         self.packet_handler = None
         self.detected_servos = {}
+        # Degrees per position count: SC servos 180° / 1024, ST/SMS 360° / 2048
+        self._deg_scale = 180.0 / 1024.0 if protocol == "scscl" else 360.0 / 2048.0
+        # Position write for the chosen protocol, set by open_connection
+        self._write_fn = None
         
     def open_connection(self):
         """Open serial port and initialize packet handler"""
@@ -63,50 +95,203 @@ class WaveshareTest:
             return False
         
         print(f"  ✓ Baud rate set to {self.baudrate}")
+
+        # 1 ms instead of the default 16 ms FTDI latency timer on every reply.
+        # The port's Serial is re-created by setBaudRate, so do it afterwards.
+        if set_low_latency is not None and set_low_latency(self.port_handler):
+            print("  ✓ Low latency mode enabled")
+        else:
+            print("  ⚠ Low latency mode not available (on Windows set the FTDI LatencyTimer to 1)")
+        # Replies are waited for in select() instead of spinning on the port.
+        # rxPacket already asks readPort for the whole remaining reply, so one
+        # wake-up normally reads it in one call. VMIN/VTIME would not help:
+        # pyserial opens the port O_NONBLOCK, where the kernel ignores them.
+        if use_blocking_reads is not None:
+            use_blocking_reads(self.port_handler)
         
         # choose handler according to protocol
         if self.protocol == "scscl":
             self.packet_handler = scscl(self.port_handler)
         else:
             self.packet_handler = sms_sts(self.port_handler)
+        self._write_fn = self._select_writer()
         return True
 
+    def _packet_timeout(self, msec):
+        """Context manager fixing the reply timeout to `msec` ms.
+
+        A no-op where the timeout helper couldn't be imported.
+        """
+        if short_packet_timeout is None:
+            return nullcontext()
+        return short_packet_timeout(self.port_handler, msec)
+
     def normalize_position(self, raw_pos):
-        """Convert raw position to signed host value when needed."""
-        try:
-            return self.packet_handler.scs_tohost(raw_pos, 15)
-        except Exception:
-            return raw_pos
+        """Convert raw position to signed host value when needed.
+
+        Same as scs_tohost(raw_pos, 15): bit 15 is a sign bit over a 15-bit
+        magnitude, not two's complement.
+        """
+        return -(raw_pos & 0x7FFF) if raw_pos & 0x8000 else raw_pos
 
     def position_to_degrees(self, pos):
         """Convert a raw position count to degrees depending on protocol.
         - SC (scscl): 180° == 1024 counts (servo mode)
         - ST/SMS (sms_sts): 360° == 2048 counts
         """
-        if self.protocol == "scscl":
-            return (pos / 1024.0) * 180.0
-        else:
-            return (pos / 2048.0) * 360.0
+        return pos * self._deg_scale
 
-    def write_position(self, servo_id, position, speed, acc):
-        """Write a position using the appropriate API on the packet handler."""
+    def _select_writer(self):
+        """Resolve the position write API of the packet handler once, see write_position."""
+        ph = self.packet_handler
         # scscl.WritePos signature: (id, position, time, speed)
         # sms_sts.WritePosEx signature: (id, position, speed, acc)
-        if self.protocol == "scscl" and hasattr(self.packet_handler, "WritePos"):
-            # Follow Arduino example: use time=0 and a higher default speed if caller passed a small value.
-            time_param = 0
+        if self.protocol == "scscl" and hasattr(ph, "WritePos"):
+            def write(servo_id, position, speed, acc):
+                # Follow Arduino example: use time=0 and a higher default speed if caller passed a small value.
+                if not isinstance(speed, int) or speed < 1000:
+                    speed = 1500
+                return ph.WritePos(servo_id, position, 0, speed)
+            return write
+        elif hasattr(ph, "WritePosEx"):
+            return ph.WritePosEx
+        elif hasattr(ph, "WritePos"):
+            # Fallback: try whichever is available
+            return lambda servo_id, position, speed, acc: ph.WritePos(servo_id, position, 0, speed)
+        return lambda servo_id, position, speed, acc: None
+
+    def write_position(self, servo_id, position, speed, acc):
+        """Write a position using the appropriate API on the packet handler."""
+        return self._write_fn(servo_id, position, speed, acc)
+
+    def make_sync_write(self, servo_ids, position, speed, acc):
+        """Build the sync write that sends `position` to all of `servo_ids`.
+
+        Same parameters as write_position. Returns the instruction packet for
+        send_sync_write, so a packet sent repeatedly is only packed once.
+        """
+        if self.protocol == "scscl" and hasattr(self.packet_handler, "SyncWritePos"):
             speed_param = speed
             if not isinstance(speed_param, int) or speed_param < 1000:
                 speed_param = 1500
-            return self.packet_handler.WritePos(servo_id, position, time_param, speed_param)
-        elif hasattr(self.packet_handler, "WritePosEx"):
-            return self.packet_handler.WritePosEx(servo_id, position, speed, acc)
+            for servo_id in servo_ids:
+                self.packet_handler.SyncWritePos(servo_id, position, 0, speed_param)
         else:
-            # Fallback: try whichever is available
-            if hasattr(self.packet_handler, "WritePos"):
-                return self.packet_handler.WritePos(servo_id, position, 0, speed)
-            return None
+            for servo_id in servo_ids:
+                self.packet_handler.SyncWritePosEx(servo_id, position, speed, acc)
+        group = self.packet_handler.groupSyncWrite
+        group.makeParam()
+        params = [group.start_address, group.data_length] + group.param
+        group.clearParam()
+        # syncWriteTxOnly addresses the SDK's BROADCAST_ID, so the packet is
+        # built for SERVO_BROADCAST_ID by hand like the sync read request
+        txpacket = [0] * (len(params) + 6)
+        txpacket[PKT_ID] = SERVO_BROADCAST_ID
+        txpacket[PKT_LENGTH] = len(params) + 2
+        txpacket[PKT_INSTRUCTION] = INST_SYNC_WRITE
+        txpacket[PKT_PARAMETER0:PKT_PARAMETER0 + len(params)] = params
+        return txpacket
+
+    def send_sync_write(self, packet):
+        """Send a packet from make_sync_write. Broadcast, so no status packets come back."""
+        # txPacket fills in the header and checksum, the same on every send
+        result = self.packet_handler.txPacket(packet)
+        self.port_handler.is_using = False
+        if result != COMM_SUCCESS:
+            raise RuntimeError(f"sync write failed: {self.packet_handler.getTxRxResult(result)}")
+        return result
     
+    def sync_read_positions(self, servo_ids):
+        """Read present positions with sync reads instead of one ReadPos per ID.
+
+        Returns {id: position} for the servos that answered.
+        """
+        servo_ids = list(servo_ids)
+        positions = {}
+        for i in range(0, len(servo_ids), SYNC_READ_BATCH):
+            batch = servo_ids[i:i + SYNC_READ_BATCH]
+            reader = GroupSyncRead(self.packet_handler, PRESENT_POSITION_ADDR, 2)
+            for servo_id in batch:
+                reader.addParam(servo_id)
+            # GroupSyncRead.txPacket addresses the SDK's BROADCAST_ID, so send
+            # the request to SERVO_BROADCAST_ID by hand and let it parse the replies
+            txpacket = [0] * (len(batch) + 8)
+            txpacket[PKT_ID] = SERVO_BROADCAST_ID
+            txpacket[PKT_LENGTH] = len(batch) + 4
+            txpacket[PKT_INSTRUCTION] = INST_SYNC_READ
+            txpacket[PKT_PARAMETER0] = PRESENT_POSITION_ADDR
+            txpacket[PKT_PARAMETER0 + 1] = 2
+            txpacket[PKT_PARAMETER0 + 2:PKT_PARAMETER0 + 2 + len(batch)] = batch
+            if self.packet_handler.txPacket(txpacket) != COMM_SUCCESS:
+                self.port_handler.is_using = False
+                continue
+            # missing IDs just don't answer, the others are still parsed
+            reader.rxPacket()
+            for servo_id in batch:
+                available, _ = reader.isAvailable(servo_id, PRESENT_POSITION_ADDR, 2)
+                if available:
+                    raw = reader.getData(servo_id, PRESENT_POSITION_ADDR, 2)
+                    positions[servo_id] = self.normalize_position(raw)
+        return positions
+
+    def read_registers(self, servo_id):
+        """Read the limit/config/goal/position registers in a single transaction.
+
+        Returns a dict of the fields used by the movement test, or None if the
+        read failed.
+        """
+        try:
+            data, comm_result, error = self.packet_handler.readTxRx(servo_id, REG_BLOCK_START, REG_BLOCK_LEN)
+        except Exception:
+            return None
+        if comm_result != COMM_SUCCESS or len(data) < REG_BLOCK_LEN:
+            return None
+
+        def byte(addr):
+            return data[addr - REG_BLOCK_START]
+
+        def word(addr):
+            return self.packet_handler.scs_makeword(byte(addr), byte(addr + 1))
+
+        return {
+            "min_angle": word(9),
+            "max_angle": word(11),
+            "offset": word(31),
+            "mode": byte(33),
+            "torque_enable": byte(40),
+            "goal_pos": word(42),
+            "goal_spd": word(46),
+            "position": self.normalize_position(word(PRESENT_POSITION_ADDR)),
+        }
+
+    def wait_until_stopped(self, servo_id, travel, max_wait):
+        """Wait for a move of estimated `travel` seconds (None if unknown) to finish.
+
+        Returns True if the servo may still be moving after `max_wait` s.
+        """
+        # Monotonic deadline, one clock read per poll
+        end_t = time.perf_counter() + max_wait
+        if travel is not None and travel < 0.15:
+            # Short move: done before the first poll would even be useful
+            time.sleep(travel + 0.05)
+            return False
+        if travel is not None:
+            # Certainly still moving for most of the estimated travel
+            time.sleep(travel * 0.7)
+        # Then poll ReadMoving with backoff until it stops or timeout
+        intervals = iter(POLL_BACKOFF)
+        while time.perf_counter() < end_t:
+            try:
+                moving, rmove, emove = self.packet_handler.ReadMoving(servo_id)
+                if rmove == COMM_SUCCESS:
+                    if moving == 0:
+                        return False
+                # else: fall through and wait
+            except Exception:
+                pass
+            time.sleep(next(intervals, POLL_BACKOFF[-1]))
+        return True
+
     def close_connection(self):
         """Close serial port"""
         if self.port_handler:
@@ -124,16 +309,43 @@ class WaveshareTest:
         
         print("Scanning ID range 0-254...")
         
-        for servo_id in range(0, 254):
-            try:
-                pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
-                if comm_result == COMM_SUCCESS:
-                    pos = self.normalize_position(pos)
-                    self.detected_servos[servo_id] = pos
-                    print(f"  ✓ ID {servo_id:3d}: position = {pos:4d}")
-                    found_count += 1
-            except Exception as e:
-                pass
+        # Per-servo lines are collected and written once, not between packets
+        out = []
+        # Two sync reads cover the whole range
+        found = self.sync_read_positions(range(0, 254))
+        for servo_id, pos in sorted(found.items()):
+            self.detected_servos[servo_id] = pos
+            out.append(f"  ✓ ID {servo_id:3d}: position = {pos:4d}")
+            found_count += 1
+        # Ping each ID, giving up on a missing one after a few ms, then read
+        # the ones that answered
+        with self._packet_timeout(SCAN_TIMEOUT_MS):
+            if found:
+                # An expected servo whose sync read reply was lost still gets
+                # a ping before it's reported missing
+                pinged = [servo_id for servo_id in expected_ids
+                          if servo_id not in found
+                          and self.packet_handler.ping(servo_id)[1] == COMM_SUCCESS]
+            else:
+                # Firmware without sync read support. The rest of the range is
+                # only swept when an expected servo is missing, e.g. to spot
+                # one still on its factory ID
+                pinged = [servo_id for servo_id in expected_ids
+                          if self.packet_handler.ping(servo_id)[1] == COMM_SUCCESS]
+                if len(pinged) < len(expected_ids):
+                    pinged += [servo_id for servo_id in range(0, 254)
+                               if servo_id not in expected_ids
+                               and self.packet_handler.ping(servo_id)[1] == COMM_SUCCESS]
+                    pinged.sort()
+        for servo_id in pinged:
+            pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
+            if comm_result == COMM_SUCCESS:
+                pos = self.normalize_position(pos)
+                self.detected_servos[servo_id] = pos
+                out.append(f"  ✓ ID {servo_id:3d}: position = {pos:4d}")
+                found_count += 1
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         print(f"\nFound {found_count} servo(s)")
         
@@ -160,22 +372,37 @@ class WaveshareTest:
         print("Servo ID | Position | Degrees")
         print("-" * 35)
         
-        all_ok = True
-        for servo_id in sorted(self.detected_servos.keys()):
+        servo_ids = sorted(self.detected_servos.keys())
+        positions = self.sync_read_positions(servo_ids)
+        # Anything the sync read missed gets a regular ReadPos
+        errors = {}
+        for servo_id in servo_ids:
+            if servo_id in positions:
+                continue
             try:
                 pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
                 if comm_result == COMM_SUCCESS:
-                    pos = self.normalize_position(pos)
-                    degrees = self.position_to_degrees(pos)
-                    print(f"  {servo_id:3d}    | {pos:4d}     | {degrees:6.1f}°")
+                    positions[servo_id] = self.normalize_position(pos)
                 else:
-                    print(f"  {servo_id:3d}    | ERROR (comm_result={comm_result})")
-                    all_ok = False
+                    errors[servo_id] = f"ERROR (comm_result={comm_result})"
             except Exception as e:
-                print(f"  {servo_id:3d}    | EXCEPTION: {e}")
-                all_ok = False
+                errors[servo_id] = f"EXCEPTION: {e}"
+
+        # Convert all positions at once
+        read_ids = [servo_id for servo_id in servo_ids if servo_id in positions]
+        pos_arr = np.array([positions[servo_id] for servo_id in read_ids], dtype=np.int32)
+        degrees = dict(zip(read_ids, pos_arr * self._deg_scale))
+
+        # The whole table in one write
+        out = []
+        for servo_id in servo_ids:
+            if servo_id in errors:
+                out.append(f"  {servo_id:3d}    | {errors[servo_id]}")
+            else:
+                out.append(f"  {servo_id:3d}    | {positions[servo_id]:4d}     | {degrees[servo_id]:6.1f}°")
+        sys.stdout.write("\n".join(out) + "\n")
         
-        return all_ok
+        return not errors
     
     def test_read_speeds(self):
         """Test 3: Read speeds from all servos"""
@@ -227,27 +454,12 @@ class WaveshareTest:
             speed = 500  # Default speed
             acceleration = 30  # Default acceleration
             
-            # Read current position to estimate move time and to fetch limits
-            pos_before = None
-            try:
-                p_before, r_before, e_before = self.packet_handler.ReadPos(servo_id)
-                if r_before == COMM_SUCCESS:
-                    pos_before = self.normalize_position(p_before)
-                else:
-                    pos_before = None
-            except Exception:
-                pos_before = None
-            # For SC servos, fetch min/max angle limits so we clamp target
-            min_ang = None
-            max_ang = None
-            try:
-                ma, rma, ema = self.packet_handler.read2ByteTxRx(servo_id, 9)
-                Mi, rmi, emi = self.packet_handler.read2ByteTxRx(servo_id, 11)
-                if rma == COMM_SUCCESS and rmi == COMM_SUCCESS:
-                    min_ang = ma
-                    max_ang = Mi
-            except Exception:
-                pass
+            # Read current position to estimate move time and to fetch limits.
+            # For SC servos the min/max angle limits are used to clamp the target.
+            regs = self.read_registers(servo_id)
+            pos_before = regs["position"] if regs else None
+            min_ang = regs["min_angle"] if regs else None
+            max_ang = regs["max_angle"] if regs else None
 
             # Send command and check result
             # Clamp requested position to limits when available
@@ -286,49 +498,35 @@ class WaveshareTest:
                 print(f"✗ Write failed (result={write_result}, err={write_error})")
                 return False
 
-            print(f"  ✓ Command sent (write_result={write_result})")
-
             # Estimate wait time from position delta and speed (seconds)
+            travel = None
             if pos_before is not None:
                 delta = abs(pos_before - position)
-                est_wait = delta / max(speed, 1) + 0.1
+                travel = delta / max(speed, 1)
+                est_wait = travel + 0.1
             else:
                 est_wait = max(duration, 0.5)
 
             max_wait = min(max(est_wait * 3, 0.5), 8.0)
 
-            # Poll ReadMoving until movement stops or timeout
-            moved = True
-            start_t = time.time()
-            while time.time() - start_t < max_wait:
-                try:
-                    moving, rmove, emove = self.packet_handler.ReadMoving(servo_id)
-                    if rmove == COMM_SUCCESS:
-                        if moving == 0:
-                            moved = False
-                            break
-                    # else: fall through and wait
-                except Exception:
-                    pass
-                time.sleep(0.05)
+            print(f"  ✓ Command sent (write_result={write_result})")
+            moved = self.wait_until_stopped(servo_id, travel, max_wait)
 
             if moved:
                 # give a small extra delay before final read
                 time.sleep(0.1)
 
-            # Read back position with retries
+            # Read back position: one read with a generous reply timeout
+            # instead of retrying on the default one
             pos = None
             comm_result = COMM_RX_TIMEOUT
             error = None
-            for attempt in range(6):
+            with self._packet_timeout(READBACK_TIMEOUT_MS):
                 try:
                     pos, comm_result, error = self.packet_handler.ReadPos(servo_id)
-                    if comm_result == COMM_SUCCESS:
-                        break
                 except Exception:
                     comm_result = COMM_RX_TIMEOUT
                     error = None
-                time.sleep(0.1)
             if comm_result == COMM_SUCCESS:
                 pos = self.normalize_position(pos)
                 degrees = self.position_to_degrees(pos)
@@ -336,39 +534,20 @@ class WaveshareTest:
                 
                 # Check if close to target
                 tolerance = 20  # ±20 units
-                if abs(pos - position) <= tolerance:
+                d = pos - position
+                if -tolerance <= d <= tolerance:
                     print(f"✓ Movement successful (within tolerance)")
                     return True
                 else:
                     print(f"⚠ Position error: expected {position}, got {pos}")
                     print("Collecting debug registers...")
-                    try:
-                        # Read some control registers for diagnosis (use 2-byte reads where appropriate)
-                        regs = {}
-                        # Torque enable (1 byte)
-                        te, r_te, e_te = self.packet_handler.read1ByteTxRx(servo_id, 40)
-                        regs['torque_enable'] = (te, r_te, e_te)
-                        # Offset (2 bytes)
-                        ofs, r_ofs, e_ofs = self.packet_handler.read2ByteTxRx(servo_id, 31)
-                        regs['offset'] = (ofs, r_ofs, e_ofs)
-                        # Mode (1 byte)
-                        mode, r_mode, e_mode = self.packet_handler.read1ByteTxRx(servo_id, 33)
-                        regs['mode'] = (mode, r_mode, e_mode)
-                        # Min/Max angle limits (2 bytes each)
-                        min_ang, r_min, e_min = self.packet_handler.read2ByteTxRx(servo_id, 9)
-                        max_ang, r_max, e_max = self.packet_handler.read2ByteTxRx(servo_id, 11)
-                        regs['min_angle'] = (min_ang, r_min, e_min)
-                        regs['max_angle'] = (max_ang, r_max, e_max)
-                        # Goal position and speed (2 bytes)
-                        gp, r_gp, e_gp = self.packet_handler.read2ByteTxRx(servo_id, 42)
-                        gs, r_gs, e_gs = self.packet_handler.read2ByteTxRx(servo_id, 46)
-                        regs['goal_pos'] = (gp, r_gp, e_gp)
-                        regs['goal_spd'] = (gs, r_gs, e_gs)
-                        # Print
+                    # Same block read as before the move, one transaction
+                    regs = self.read_registers(servo_id)
+                    if regs is None:
+                        print("  Debug read failed")
+                    else:
                         for k, v in regs.items():
                             print(f"  {k}: {v}")
-                    except Exception as e:
-                        print(f"  Debug read failed: {e}")
                     return False
             else:
                 # try verbose fallback: ReadPosSpeed
@@ -404,31 +583,46 @@ class WaveshareTest:
         print(f"Moving {len(servo_ids)} servos in {num_cycles} cycles...")
         
         try:
+            # Same three packets every cycle, pack them once
+            waypoints = {pos: self.make_sync_write(servo_ids, pos, 500, 30) for pos in (1024, 512, 1536)}
+
             for cycle in range(num_cycles):
                 print(f"\nCycle {cycle + 1}/{num_cycles}")
                 
                 # Move to center position
                 print("  Moving to center (1024)...")
-                for servo_id in servo_ids:
-                    self.write_position(servo_id, 1024, 500, 30)
+                self.send_sync_write(waypoints[1024])
                 time.sleep(1)
                 
                 # Move to low position
                 print("  Moving to low (512)...")
-                for servo_id in servo_ids:
-                    self.write_position(servo_id, 512, 500, 30)
+                self.send_sync_write(waypoints[512])
                 time.sleep(1)
                 
                 # Move to high position
                 print("  Moving to high (1536)...")
-                for servo_id in servo_ids:
-                    self.write_position(servo_id, 1536, 500, 30)
+                self.send_sync_write(waypoints[1536])
                 time.sleep(1)
             
             # Return to center
             print("\nReturning all servos to center...")
+            self.send_sync_write(waypoints[1024])
+            time.sleep(1)
+            
+            # Nothing acknowledges a sync write, read back that the servos
+            # actually followed it
+            tolerance = 20  # ±20 units
+            positions = self.sync_read_positions(servo_ids)
             for servo_id in servo_ids:
-                self.write_position(servo_id, 1024, 500, 30)
+                if servo_id not in positions:
+                    pos, comm_result, _ = self.packet_handler.ReadPos(servo_id)
+                    if comm_result == COMM_SUCCESS:
+                        positions[servo_id] = self.normalize_position(pos)
+            off_center = [servo_id for servo_id in servo_ids
+                          if abs(positions.get(servo_id, 1024 + 2 * tolerance) - 1024) > tolerance]
+            if off_center:
+                print(f"✗ Servos not back at center: {off_center}")
+                return False
             
             print("✓ All movement cycles completed")
             return True
@@ -476,7 +670,9 @@ class WaveshareTest:
             
             # Test position reading
             print("Reading positions via HWI...")
-            positions = hwi.get_present_positions()
+            # Filled in place, no new array per read
+            pos_buf = np.empty(len(hwi.joints))
+            positions = hwi.get_present_positions(out=pos_buf)
             if positions is not None:
                 print(f"✓ Got positions: shape={positions.shape}")
                 print(f"  Sample values: {positions[:3]}")
@@ -3,11 +3,12 @@
 Produces a JSON mapping of ``id -> observed_count`` which can be used to
 compute offsets for `duck_config.json` or a separate calibration file.
 """
-import time
 import json
 from scservo_sdk import PortHandler
 from scservo_sdk import scscl
 
+from port_utils import wait_stop
+
 PORT = "COM5"
 BAUD = 1000000
 
@@ -38,7 +39,7 @@ def main():
         except Exception as e:
             print(f"WritePos failed for {sid}: {e}")
             continue
-        time.sleep(0.8)
+        wait_stop(packet, [sid], timeout=0.8)
         try:
             pos, _, _ = packet.ReadPos(sid)
             results[sid] = pos
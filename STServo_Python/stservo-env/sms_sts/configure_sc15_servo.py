@@ -33,10 +33,15 @@ else:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         return ch
 
-sys.path.append("..")
+# The SDK lives next to this folder (stservo-env/scservo_sdk); resolve it from
+# the script location rather than the current directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-
-from scservo_sdk import *
+from scservo_sdk import PortHandler, scscl
+from scservo_sdk.scscl import SCSCL_GOAL_POSITION_L
+from scservo_sdk.scservo_def import COMM_SUCCESS, INST_PING, INST_SYNC_WRITE
+from scservo_sdk.protocol_packet_handler import PKT_ID, PKT_INSTRUCTION, PKT_LENGTH, PKT_PARAMETER0
+from port_utils import set_low_latency, short_packet_timeout, use_blocking_reads, wait_stop
 
 # ---------------- USER CONFIG ----------------
 BAUDRATE   = 1_000_000
@@ -49,153 +54,201 @@ TEST_RIGHT = 600
 MOVE_SPEED = 600             # safe bench speed
 MOVE_ACC   = 30              # soft accel
 SCAN_RANGE = range(0, 254)   # valid ID range
+SCAN_TIMEOUT_MS = 5          # per-ID reply timeout while scanning
 # ---------------------------------------------
 
-parser = argparse.ArgumentParser()
-parser.add_argument("--new_id", type=int, required=True, help="New ID for this servo (0–253)")
-parser.add_argument("--only_id", action="store_true", help="Only set ID; skip centering and movement verification")
-args = parser.parse_args()
-
-print("\n=== SC-15 Servo Configuration ===")
-print("⚠️  Ensure ONLY ONE SERVO is connected")
-print("================================\n")
-
-# Initialize port
-portHandler = PortHandler(DEVICENAME)
-# Use SCSCL handler for SC-15 servos (SC protocol)
-packetHandler = scscl(portHandler)
-
 # ID register address for SC servos
 ID_ADDR = 5
+# Broadcast id the servos act on; the SDK's BROADCAST_ID (0xFF) isn't one
+SERVO_BROADCAST_ID = 0xFE
+# goal position word in the sync-write packet: after start address, data length and id
+POS_OFF = PKT_PARAMETER0 + 3
+
+
+def broadcast_ping(portHandler, packetHandler):
+    # With a single servo on the bus a PING to the broadcast id is
+    # answered with that servo's id. The SDK's ping() refuses broadcast ids,
+    # so send it by hand.
+    txpacket = [0] * 6
+    txpacket[PKT_ID] = SERVO_BROADCAST_ID
+    txpacket[PKT_LENGTH] = 2
+    txpacket[PKT_INSTRUCTION] = INST_PING
+    if packetHandler.txPacket(txpacket) != COMM_SUCCESS:
+        return None
+    portHandler.setPacketTimeout(6)
+    rxpacket, comm = packetHandler.rxPacket()
+    if comm != COMM_SUCCESS:
+        return None
+    return rxpacket[PKT_ID]
+
+
+def find_servo(portHandler, packetHandler):
+    found_id = broadcast_ping(portHandler, packetHandler)
+    if found_id is None:
+        # Some firmwares ignore broadcast pings, probe ids one by one
+        with short_packet_timeout(portHandler, SCAN_TIMEOUT_MS):
+            for sid in SCAN_RANGE:
+                try:
+                    _, comm, err = packetHandler.ping(sid)
+                    if comm == COMM_SUCCESS:
+                        found_id = sid
+                        break
+                except:
+                    pass
+    return found_id
+
+
+def change_id(packetHandler, old_id, new_id):
+    """Unlock EPROM, write the ID, lock again under the new ID, then confirm
+    by reading it back (retries for up to ~0.5 s instead of fixed sleeps)."""
+    res_unlock, err_unlock = packetHandler.unLockEprom(old_id)
+    if res_unlock != COMM_SUCCESS:
+        print(f"❌ Failed to unlock EPROM (result={res_unlock}, err={err_unlock})")
+        return False
 
-if not portHandler.openPort():
-    print("❌ Failed to open port")
-    quit()
-
-if not portHandler.setBaudRate(BAUDRATE):
-    print("❌ Failed to set baudrate")
-    quit()
-
-print("✔ Port opened, baudrate set")
-
-# ---------- Scan for servo ----------
-found_id = None
-print("\nScanning for servo ID...")
+    print(f"Writing new ID {new_id} to address {ID_ADDR} at servo {old_id}...")
+    res_write, err_write = packetHandler.write1ByteTxRx(old_id, ID_ADDR, new_id)
+    if res_write != COMM_SUCCESS:
+        print(f"❌ Failed to write new ID (result={res_write}, err={err_write})")
+        return False
 
-for sid in SCAN_RANGE:
-    try:
-        pos, spd, comm, err = packetHandler.ReadPosSpeed(sid)
-        if comm == COMM_SUCCESS:
-            print(f"✔ Found servo at ID {sid}, position {pos}")
-            found_id = sid
-            break
-    except:
-        pass
+    # The servo answers on its new ID from here on; the lock write commits EPROM
+    res_lock, err_lock = packetHandler.LockEprom(new_id)
+    if res_lock != COMM_SUCCESS:
+        print(f"Lock with new ID failed (res={res_lock}, err={err_lock}), trying lock with old ID...")
+        res_lock, err_lock = packetHandler.LockEprom(old_id)
+        if res_lock != COMM_SUCCESS:
+            print(f"⚠️  Warning: failed to lock EPROM (result={res_lock}, err={err_lock})")
+
+    for _ in range(10):
+        new_id_val, res_read, err_read = packetHandler.read1ByteTxRx(new_id, ID_ADDR)
+        if res_read == COMM_SUCCESS and new_id_val == new_id:
+            return True
+        time.sleep(0.05)
+    print(f"❌ Verification failed: read={new_id_val} (result={res_read}, err={err_read})")
+    return False
+
+
+def make_pos_packet(packetHandler, sid):
+    """Build the sync-write goal position packet for `sid` once.
+
+    Only the position word and the checksum change between moves, send_pos
+    patches those in place.
+    """
+    data = [sid, 0, 0,
+            packetHandler.scs_lobyte(MOVE_SPEED), packetHandler.scs_hibyte(MOVE_SPEED),
+            packetHandler.scs_lobyte(MOVE_ACC), packetHandler.scs_hibyte(MOVE_ACC)]
+    buf = bytearray(len(data) + 8)
+    buf[0] = buf[1] = 0xFF
+    buf[PKT_ID] = SERVO_BROADCAST_ID
+    buf[PKT_LENGTH] = len(data) + 4
+    buf[PKT_INSTRUCTION] = INST_SYNC_WRITE
+    buf[PKT_PARAMETER0] = SCSCL_GOAL_POSITION_L
+    buf[PKT_PARAMETER0 + 1] = len(data) - 1
+    buf[PKT_PARAMETER0 + 2:-1] = bytes(data)
+    return buf
+
+
+def send_pos(portHandler, packetHandler, buf, pos):
+    # scscl is big-endian, go through the handler rather than packing by hand
+    buf[POS_OFF] = packetHandler.scs_lobyte(pos)
+    buf[POS_OFF + 1] = packetHandler.scs_hibyte(pos)
+    buf[-1] = ~sum(buf[2:-1]) & 0xFF
+    # Sync write is broadcast: no status packet to wait for
+    portHandler.clearPort()
+    portHandler.writePort(buf)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--new_id", type=int, required=True, help="New ID for this servo (0–253)")
+    parser.add_argument("--only_id", action="store_true", help="Only set ID; skip centering and movement verification")
+    args = parser.parse_args(argv)
+
+    print("\n=== SC-15 Servo Configuration ===")
+    print("⚠️  Ensure ONLY ONE SERVO is connected")
+    print("================================\n")
+
+    # Initialize port
+    portHandler = PortHandler(DEVICENAME)
+    # Use SCSCL handler for SC-15 servos (SC protocol)
+    packetHandler = scscl(portHandler)
+
+    if not portHandler.openPort():
+        print("❌ Failed to open port")
+        return
+
+    if not portHandler.setBaudRate(BAUDRATE):
+        print("❌ Failed to set baudrate")
+        return
+
+    # 1 ms instead of 16 ms USB latency per round-trip (no-op where unsupported)
+    set_low_latency(portHandler)
+    use_blocking_reads(portHandler)
+
+    print("✔ Port opened, baudrate set")
+
+    # ---------- Scan for servo ----------
+    print("\nScanning for servo ID...")
+    found_id = find_servo(portHandler, packetHandler)
+
+    if found_id is None:
+        print("❌ No servo detected. Check power & wiring.")
+        portHandler.closePort()
+        return
 
-if found_id is None:
-    print("❌ No servo detected. Check power & wiring.")
-    portHandler.closePort()
-    quit()
+    pos, comm, err = packetHandler.ReadPos(found_id)
+    print(f"✔ Found servo at ID {found_id}, position {pos}")
 
-# ---------- Move to center (optional) ----------
-if not args.only_id:
-    print(f"\nMoving servo ID {found_id} to CENTER ({CENTER_POS})")
-    packetHandler.WritePos(found_id, CENTER_POS, MOVE_SPEED, MOVE_ACC)
-    time.sleep(2)
+    # ---------- Move to center (optional) ----------
+    if not args.only_id:
+        print(f"\nMoving servo ID {found_id} to CENTER ({CENTER_POS})")
+        packetHandler.WritePos(found_id, CENTER_POS, MOVE_SPEED, MOVE_ACC)
+        wait_stop(packetHandler, [found_id], timeout=2.0)
 
-    print("\n➡️  POWER OFF NOW")
-    print("➡️  Mount horn at mechanical neutral")
-    input("Press ENTER after mounting horn...")
-else:
-    print("\n--only_id set: skipping centering and horn mounting prompt")
+        print("\n➡️  POWER OFF NOW")
+        print("➡️  Mount horn at mechanical neutral")
+        input("Press ENTER after mounting horn...")
+    else:
+        print("\n--only_id set: skipping centering and horn mounting prompt")
+
+    # ---------- Assign new ID ----------
+    if found_id != args.new_id:
+        print(f"\nChanging ID {found_id} → {args.new_id}")
+        if not change_id(packetHandler, found_id, args.new_id):
+            portHandler.closePort()
+            return
+        print(f"✔ ID successfully set to {args.new_id}")
+        current_id = args.new_id
+    else:
+        current_id = found_id
+        print("ID already correct, skipping ID change")
+
+    # ---------- Verification (optional) ----------
+    if not args.only_id:
+        print("\nVerifying motion...")
+        pos_packet = make_pos_packet(packetHandler, current_id)
+        for target in (TEST_LEFT, TEST_RIGHT, CENTER_POS):
+            send_pos(portHandler, packetHandler, pos_packet, target)
+            wait_stop(packetHandler, [current_id], timeout=1.0)
+    else:
+        print("--only_id set: skipping motion verification")
 
-# ---------- Assign new ID ----------
-if found_id != args.new_id:
-    print(f"\nChanging ID {found_id} → {args.new_id}")
+    # ---------- Read feedback ----------
+    pos, spd, comm, err = packetHandler.ReadPosSpeed(current_id)
+    # volt, load, comm, err = packetHandler.ReadVoltageLoad(current_id)
 
-    # Read current ID register for debug
-    cur_id_val, res_cur, err_cur = packetHandler.read1ByteTxRx(found_id, ID_ADDR)
-    print(f"Current ID register (at {found_id}): read={cur_id_val} (res={res_cur}, err={err_cur})")
+    print("\n===")
+    print("Servo configured successfully")
+    print(f"Final ID: {current_id}")
+    print(f"Position: {pos}")
+    # print(f"Voltage : {volt / 10:.1f} V")
+    # print(f"Load    : {load}")
+    print("===")
 
-    # Unlock EPROM so the ID write is persisted
-    print("Unlocking EPROM...")
-    res_unlock, err_unlock = packetHandler.unLockEprom(found_id)
-    if res_unlock != COMM_SUCCESS:
-        print(f"❌ Failed to unlock EPROM (result={res_unlock}, err={err_unlock})")
-        portHandler.closePort()
-        quit()
+    portHandler.closePort()
+    print("\nYou can now disconnect this servo and move to the next one.")
 
-    # Write new ID to EPROM (write to current address)
-    print(f"Writing new ID {args.new_id} to address {ID_ADDR} at servo {found_id}...")
-    res_write, err_write = packetHandler.write1ByteTxRx(found_id, ID_ADDR, args.new_id)
-    time.sleep(0.8)
-    if res_write != COMM_SUCCESS:
-        print(f"❌ Failed to write new ID (result={res_write}, err={err_write})")
-        portHandler.closePort()
-        quit()
-
-    # Redundant write and small delay to improve persistence on flaky units
-    print("Performing redundant write to increase chance of EPROM commit...")
-    res_write2, err_write2 = packetHandler.write1ByteTxRx(found_id, ID_ADDR, args.new_id)
-    time.sleep(0.8)
-    print(f"Write results: first={res_write}, second={res_write2}")
-    if res_write2 != COMM_SUCCESS:
-        print(f"⚠ Second write failed (result={res_write2}, err={err_write2})")
-
-    # After writing, attempt to lock EPROM. Try locking using the new ID first, fall back to old ID.
-    print("Locking EPROM (try new ID)...")
-    res_lock, err_lock = packetHandler.LockEprom(args.new_id)
-    print(f"Lock attempt result (new ID): res={res_lock}, err={err_lock}")
-    if res_lock != COMM_SUCCESS:
-        print("Lock with new ID failed, trying lock with old ID...")
-        res_lock_old, err_lock_old = packetHandler.LockEprom(found_id)
-        print(f"Lock old ID result: {res_lock_old}, err={err_lock_old}")
 
-    # Give EPROM time to settle before closing or power-cycling
-    time.sleep(1.2)
-    if res_lock != COMM_SUCCESS:
-        print(f"⚠️  Warning: failed to lock EPROM (result={res_lock}, err={err_lock})")
-
-    # Verify new ID by reading it back from both old and new addresses
-    time.sleep(0.5)
-    new_id_val, res_read, err_read = packetHandler.read1ByteTxRx(args.new_id, ID_ADDR)
-    old_id_val, res_old_read, err_old_read = packetHandler.read1ByteTxRx(found_id, ID_ADDR)
-    print(f"Read at new ID {args.new_id}: {new_id_val} (res={res_read}, err={err_read})")
-    print(f"Read at old ID {found_id}: {old_id_val} (res={res_old_read}, err={err_old_read})")
-    if res_read == COMM_SUCCESS and new_id_val == args.new_id:
-        print(f"✔ ID successfully set to {new_id_val}")
-        current_id = args.new_id
-    else:
-        print(f"❌ Verification failed: read={new_id_val} (result={res_read}, err={err_read})")
-        portHandler.closePort()
-        quit()
-else:
-    current_id = found_id
-    print("ID already correct, skipping ID change")
-
-# ---------- Verification (optional) ----------
-if not args.only_id:
-    print("\nVerifying motion...")
-    packetHandler.WritePos(current_id, TEST_LEFT, MOVE_SPEED, MOVE_ACC)
-    time.sleep(1)
-    packetHandler.WritePos(current_id, TEST_RIGHT, MOVE_SPEED, MOVE_ACC)
-    time.sleep(1)
-    packetHandler.WritePos(current_id, CENTER_POS, MOVE_SPEED, MOVE_ACC)
-    time.sleep(1)
-else:
-    print("--only_id set: skipping motion verification")
-
-# ---------- Read feedback ----------
-pos, spd, comm, err = packetHandler.ReadPosSpeed(current_id)
-# volt, load, comm, err = packetHandler.ReadVoltageLoad(current_id)
-
-print("\n===")
-print("Servo configured successfully")
-print(f"Final ID: {current_id}")
-print(f"Position: {pos}")
-# print(f"Voltage : {volt / 10:.1f} V")
-# print(f"Load    : {load}")
-print("===")
-
-portHandler.closePort()
-print("\nYou can now disconnect this servo and move to the next one.")
+if __name__ == "__main__":
+    main()
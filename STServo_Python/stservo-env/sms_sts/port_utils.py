@@ -0,0 +1,121 @@
+"""Serial port helpers shared by the sms_sts bench scripts.
+
+Same low latency setup as mini_bdx_runtime.serial_utils, kept here so the
+scripts don't need the runtime package (and its onnxruntime import).
+"""
+import select
+import struct
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Windows
+    fcntl = None
+    termios = None
+
+# <linux/serial.h>
+TIOCGSERIAL = getattr(termios, "TIOCGSERIAL", 0x541E)
+TIOCSSERIAL = getattr(termios, "TIOCSSERIAL", 0x541F)
+ASYNC_LOW_LATENCY = 0x2000
+# big enough for struct serial_struct, `flags` is its 5th int
+_SERIAL_STRUCT_SIZE = 128
+_FLAGS_OFFSET = 16
+
+COMM_SUCCESS = 0  # scservo_def.COMM_SUCCESS
+
+
+def set_low_latency(portHandler):
+    """Drop the 16 ms USB-serial latency timer to ~1 ms (ASYNC_LOW_LATENCY).
+
+    Call after `setBaudRate`, which re-creates the port's `Serial`.
+    Returns False where the platform or driver doesn't support it (on Windows
+    set the FTDI LatencyTimer to 1 in the device manager instead).
+    """
+    ser = getattr(portHandler, "ser", None)
+    if ser is None:
+        return False
+
+    if hasattr(ser, "set_low_latency_mode"):
+        try:
+            ser.set_low_latency_mode(True)
+            return True
+        except (ValueError, OSError):
+            return False
+
+    fd = getattr(ser, "fd", None)
+    if fd is None or fcntl is None:
+        return False
+    try:
+        buf = bytearray(_SERIAL_STRUCT_SIZE)
+        fcntl.ioctl(fd, TIOCGSERIAL, buf)
+        (flags,) = struct.unpack_from("i", buf, _FLAGS_OFFSET)
+        struct.pack_into("i", buf, _FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, TIOCSSERIAL, buf)
+    except OSError:
+        return False
+    return True
+
+
+def use_blocking_reads(portHandler):
+    """Make the SDK's `readPort` sleep in `select` until reply bytes arrive.
+
+    `rxPacket` polls `readPort` on a `timeout=0` port until the status packet
+    or its timeout is complete, i.e. it spins a core on read syscalls. The
+    replacement waits for the fd to become readable (bounded by the remaining
+    packet timeout) and then does the non-blocking read; `rxPacket` already
+    accumulates partial reads, so no extra buffering is needed.
+
+    Returns False (port left alone) where the serial object has no pollable
+    fd, e.g. on Windows.
+    """
+    ser = getattr(portHandler, "ser", None)
+    if getattr(ser, "fd", None) is None:
+        return False
+
+    def readPort(length):
+        # look the Serial up each time, setBaudRate replaces it
+        ser = portHandler.ser
+        remaining = (portHandler.packet_timeout - portHandler.getTimeSinceStart()) / 1000.0
+        if remaining > 0:
+            select.select([ser.fd], [], [], remaining)
+        return ser.read(length)
+
+    portHandler.readPort = readPort
+    return True
+
+
+def wait_stop(pkt, ids, timeout=2.0, period=0.02):
+    """Poll ReadMoving (~50 Hz) until every servo in `ids` has stopped.
+
+    Returns True once they all report not moving, False after `timeout` s
+    (so a servo that doesn't answer costs the same as the old fixed sleep).
+    """
+    pending = list(ids)
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        time.sleep(period)
+        still_moving = []
+        for sid in pending:
+            moving, comm, _ = pkt.ReadMoving(sid)
+            if comm != COMM_SUCCESS or moving:
+                still_moving.append(sid)
+        pending = still_moving
+    return not pending
+
+
+@contextmanager
+def short_packet_timeout(portHandler, msec):
+    """Cap the reply timeout of every transaction to `msec` ms inside the block.
+
+    The SDK re-arms the timeout from the packet length in each txRxPacket,
+    with a 50 ms latency budget, so every missing ID in a scan costs that much.
+    A status packet at 1 Mbps takes well under 1 ms.
+    """
+    portHandler.setPacketTimeout = lambda packet_length: portHandler.setPacketTimeoutMillis(msec)
+    try:
+        yield portHandler
+    finally:
+        # drop the instance override, the class method is visible again
+        del portHandler.setPacketTimeout